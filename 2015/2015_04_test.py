@@ -1,4 +1,7 @@
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+from os import cpu_count
 
 
 def mine(key, depth=5):
@@ -34,8 +37,56 @@ def mine(key, depth=5):
         ans += 1
 
 
+def mine_range(key, start, stop, depth=5):
+    """
+    First number in range(start, stop) whose hash has depth leading zero
+    nibbles, or None. The key is hashed once and its MD5 midstate copied for
+    every number, and the zeroes are checked on the raw digest bytes.
+    """
+    midstate = hashlib.md5(key.encode())
+    zero_bytes = bytes(depth // 2)
+    half_byte = depth % 2
+    for ans in range(start, stop):
+        md5 = midstate.copy()
+        md5.update(str(ans).encode())
+        digest = md5.digest()
+        if digest.startswith(zero_bytes) and (
+            not half_byte or digest[depth // 2] < 0x10
+        ):
+            return ans
+    return None
+
+
+def mine_parallel(key, depth=5, chunk_size=100_000, workers=None):
+    """
+    Fans consecutive chunk_size ranges out over a process pool, one round of
+    workers ranges at a time, and takes the first hit in index order.
+    """
+    workers = workers or cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        for round_start in count(0, chunk_size * workers):
+            starts = range(round_start, round_start + chunk_size * workers, chunk_size)
+            for ans in pool.map(
+                mine_range,
+                [key] * workers,
+                starts,
+                [start + chunk_size for start in starts],
+                [depth] * workers,
+            ):
+                if ans is not None:
+                    return (ans, hashlib.md5(f"{key}{ans}".encode()).hexdigest())
+
+
 def test_mine():
     assert mine("abcdef")[0] == 609043
     assert mine("pqrstuv")[0] == 1048970
     assert mine("iwrupvqb")[0] == 346386
     assert mine("iwrupvqb", depth=6)[0] == 9958218
+
+
+def test_mine_parallel():
+    assert mine_range("abcdef", 0, 609043) is None
+    assert mine_range("abcdef", 0, 609044) == 609043
+    assert mine_parallel("abcdef", chunk_size=50_000, workers=2)[0] == 609043
+    assert mine_parallel("pqrstuv")[1].startswith("00000")
+    assert mine_parallel("iwrupvqb")[0] == 346386
@@ -84,37 +84,30 @@ class Lights:
     def count(self):
         return sum(sum(self.grid))
 
+    def region(self, ul, lr):
+        return slice(ul[0], lr[0] + 1), slice(ul[1], lr[1] + 1)
+
     def on(self, ul, lr):
-        for x in range(ul[0], lr[0] + 1):
-            for y in range(ul[1], lr[1] + 1):
-                self.grid[x][y] = self.f_on(self.grid[x][y])
+        region = self.region(ul, lr)
+        self.grid[region] = self.f_on(self.grid[region])
 
     def off(self, ul, lr):
-        for x in range(ul[0], lr[0] + 1):
-            for y in range(ul[1], lr[1] + 1):
-                self.grid[x][y] = self.f_off(self.grid[x][y])
+        region = self.region(ul, lr)
+        self.grid[region] = self.f_off(self.grid[region])
 
     def toggle(self, ul, lr):
-        for x in range(ul[0], lr[0] + 1):
-            for y in range(ul[1], lr[1] + 1):
-                self.grid[x][y] = self.f_toggle(self.grid[x][y])
+        region = self.region(ul, lr)
+        self.grid[region] = self.f_toggle(self.grid[region])
 
     def execute_direction(self, direction):
-        exp = (
-            r"(?P<action>turn on|turn off|toggle)"
-            + r" (?P<start_x>\d+),(?P<start_y>\d+)"
-            + r" through"
-            + r" (?P<end_x>\d+),(?P<end_y>\d+)"
-        )
-        m = re.match(exp, direction)
-        if m:
-            ul = (int(m.group("start_x")), int(m.group("start_y")))
-            lr = (int(m.group("end_x")), int(m.group("end_y")))
-            if m.group("action") == "toggle":
+        parsed = parse_direction(direction)
+        if parsed:
+            action, ul, lr = parsed
+            if action == "toggle":
                 self.toggle(ul, lr)
-            elif m.group("action") == "turn off":
+            elif action == "turn off":
                 self.off(ul, lr)
-            elif m.group("action") == "turn on":
+            elif action == "turn on":
                 self.on(ul, lr)
 
     def execute_directions(self):
@@ -125,6 +118,21 @@ class Lights:
                 line = fp.readline()
 
 
+def parse_direction(direction):
+    exp = (
+        r"(?P<action>turn on|turn off|toggle)"
+        + r" (?P<start_x>\d+),(?P<start_y>\d+)"
+        + r" through"
+        + r" (?P<end_x>\d+),(?P<end_y>\d+)"
+    )
+    m = re.match(exp, direction)
+    if m:
+        ul = (int(m.group("start_x")), int(m.group("start_y")))
+        lr = (int(m.group("end_x")), int(m.group("end_y")))
+        return m.group("action"), ul, lr
+    return None
+
+
 def test_lights():
     lights = Lights()
     assert lights.count() == 0
@@ -151,7 +159,7 @@ class NewLights(Lights):
         return x + 1
 
     def f_off(self, x):
-        return max(x - 1, 0)
+        return np.maximum(x - 1, 0)
 
     def f_toggle(self, x):
         return x + 2
@@ -161,3 +169,62 @@ def test_new_lights():
     lights = NewLights()
     lights.execute_directions()
     assert int(lights.count()) == 14687245
+
+
+class CompressedLights(Lights):
+    """
+    Lights over only the distinct x/y breakpoints of a known list of
+    directions: each compressed cell stands for a block of identical lights
+    and count() weights it by that block's area, so the grid size depends on
+    the number of directions rather than on the coordinates.
+    """
+
+    def __init__(self, directions):
+        self.directions = [
+            direction for direction in directions if parse_direction(direction)
+        ]
+        rectangles = [parse_direction(direction)[1:] for direction in self.directions]
+        self.xs = np.array(
+            sorted({c for ul, lr in rectangles for c in (ul[0], lr[0] + 1)})
+        )
+        self.ys = np.array(
+            sorted({c for ul, lr in rectangles for c in (ul[1], lr[1] + 1)})
+        )
+        self.weights = np.outer(np.diff(self.xs), np.diff(self.ys))
+        self.grid = np.zeros(self.weights.shape, dtype=np.int64)
+
+    def region(self, ul, lr):
+        x0, x1 = np.searchsorted(self.xs, (ul[0], lr[0] + 1))
+        y0, y1 = np.searchsorted(self.ys, (ul[1], lr[1] + 1))
+        return slice(x0, x1), slice(y0, y1)
+
+    def count(self):
+        return int((self.grid * self.weights).sum())
+
+    def execute_directions(self):
+        for direction in self.directions:
+            self.execute_direction(direction)
+
+
+class CompressedNewLights(CompressedLights, NewLights):
+    pass
+
+
+def test_compressed_lights():
+    with open(Path(__file__).parent / "2015_06_input.txt", "r") as fp:
+        directions = fp.readlines()
+    lights = CompressedLights(directions)
+    lights.execute_directions()
+    assert lights.count() == 543903
+    lights = CompressedNewLights(directions)
+    lights.execute_directions()
+    assert lights.count() == 14687245
+    scaled = []
+    for direction in directions:
+        action, ul, lr = parse_direction(direction)
+        scaled.append(
+            f"{action} {ul[0] * 100},{ul[1] * 100} through {lr[0] * 100 + 99},{lr[1] * 100 + 99}"
+        )
+    lights = CompressedNewLights(scaled)
+    lights.execute_directions()
+    assert lights.count() == 14687245 * 100 * 100
@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import List, NamedTuple
 from collections import defaultdict
 
+import numpy as np
+
 
 class Point(NamedTuple):
     x: int
@@ -145,6 +147,50 @@ class Board:
         return len(self.state)
 
 
+def neighbor_sum(grid):
+    """
+    Number of the eight neighbours set, counting cells off the edge as off.
+    """
+    padded = np.pad(grid.astype(np.uint8), 1)
+    rows, cols = grid.shape
+    counts = np.zeros(grid.shape, dtype=np.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                counts += padded[dy : dy + rows, dx : dx + cols]
+    return counts
+
+
+class LifeGrid:
+    """
+    Same rules as Board on a numpy boolean grid, with the on count of every
+    step kept in on_counts.
+    """
+
+    def __init__(self, raw: List, broken=False):
+        self.grid = np.array([[c == "#" for c in line] for line in raw], dtype=bool)
+        self.broken = broken
+        self.on_counts = []
+        if self.broken:
+            self.set_broken()
+
+    def set_broken(self):
+        self.grid[[0, 0, -1, -1], [0, -1, 0, -1]] = True
+
+    def step(self):
+        counts = neighbor_sum(self.grid)
+        self.grid = (counts == 3) | (self.grid & (counts == 2))
+        if self.broken:
+            self.set_broken()
+        self.on_counts.append(int(self.grid.sum()))
+        return self.on_counts[-1]
+
+    def run(self, steps):
+        for _ in range(steps):
+            self.step()
+        return self.on_counts[-1]
+
+
 SAMPLE = [".#.#.#", "...##.", "#....#", "..#...", "#.#..#", "####.."]
 
 
@@ -172,3 +218,16 @@ def test_submission():
     for _ in range(100):
         num_on = broken_board.step()
     assert num_on == 1006
+
+
+def test_life_grid():
+    assert LifeGrid(SAMPLE).run(4) == 4
+    assert LifeGrid(SAMPLE, broken=True).run(5) == 17
+    assert LifeGrid(SUBMISSION).run(100) == 1061
+    broken_grid = LifeGrid(SUBMISSION, broken=True)
+    assert broken_grid.run(100) == 1006
+    assert len(broken_grid.on_counts) == 100
+    large = LifeGrid([line * 10 for line in SUBMISSION] * 10)
+    assert large.grid.shape == (1000, 1000)
+    large.run(1_000)
+    assert len(large.on_counts) == 1_000
@@ -1,4 +1,7 @@
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+from os import cpu_count
 
 
 class Puzzle:
@@ -117,6 +120,54 @@ def find_password2(id):
     return "".join(known)
 
 
+def interesting_in_range(id, start, stop):
+    """
+    (index, hex hash) for every index in range(start, stop) whose hash starts
+    with five zeroes, hashing from a copy of the Door ID midstate and testing
+    the raw digest bytes rather than the hex string.
+    """
+    midstate = hashlib.md5(id.encode("utf-8"))
+    found = []
+    for index in range(start, stop):
+        md5 = midstate.copy()
+        md5.update(str(index).encode("utf-8"))
+        digest = md5.digest()
+        if digest[0] == 0 and digest[1] == 0 and digest[2] < 0x10:
+            found.append((index, digest.hex()))
+    return found
+
+
+def interesting_hashes(id, chunk_size=250_000, workers=None):
+    workers = workers or cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        for round_start in count(0, chunk_size * workers):
+            starts = range(round_start, round_start + chunk_size * workers, chunk_size)
+            for found in pool.map(
+                interesting_in_range,
+                [id] * workers,
+                starts,
+                [start + chunk_size for start in starts],
+            ):
+                yield from found
+
+
+def find_password_parallel(id, **kwargs):
+    pwd = []
+    for _, my_hash in interesting_hashes(id, **kwargs):
+        pwd.append(my_hash[5])
+        if len(pwd) == 8:
+            return "".join(pwd)
+
+
+def find_password2_parallel(id, **kwargs):
+    known = ["-"] * 8
+    for _, my_hash in interesting_hashes(id, **kwargs):
+        if my_hash[5] in "01234567" and known[int(my_hash[5])] == "-":
+            known[int(my_hash[5])] = my_hash[6]
+            if "-" not in known:
+                return "".join(known)
+
+
 def test_next_character():
     assert next_character(SAMPLE, 0) == ("1", 3231930)
 
@@ -129,3 +180,12 @@ def test_find_password():
 def test_find_password2():
     assert find_password2(SAMPLE) == "05ace8e3"
     assert find_password2(INPUTS) == "999828ec"
+
+
+def test_find_password_parallel():
+    assert interesting_in_range(SAMPLE, 3231929, 3231930)[0][1].startswith("000001")
+    assert interesting_in_range(SAMPLE, 3231929, 3231930)[0][1][5:7] == "15"
+    assert find_password_parallel(SAMPLE, chunk_size=1_000_000, workers=2) == "18f47a30"
+    assert (
+        find_password2_parallel(SAMPLE, chunk_size=1_000_000, workers=2) == "05ace8e3"
+    )
@@ -1,6 +1,9 @@
 import hashlib
 import re
-from collections import deque
+from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+from os import cpu_count
 
 
 class Puzzle:
@@ -75,17 +78,53 @@ class Puzzle:
     pass
 
 
-def get_key(salt, stretched=False):
-    hi = 0
+def hash_range(salt, start, stop, stretched=False):
+    midstate = hashlib.md5(salt.encode('utf-8'))
+    hashes = []
+    for index in range(start, stop):
+        md5 = midstate.copy()
+        md5.update(str(index).encode('utf-8'))
+        h = md5.hexdigest()
+        if stretched:
+            h = h.encode('utf-8')
+            for _ in range(2016):
+                h = hashlib.md5(h).hexdigest().encode('utf-8')
+            h = h.decode('utf-8')
+        hashes.append(h)
+    return hashes
+
+
+def hash_stream(salt, stretched=False, chunk_size=1000, workers=None, cached=None):
+    """
+    Yields (index, hash) in order. New hashes are produced in chunk_size ranges
+    fanned out over a process pool. Pass the same cached list to later streams
+    with the same salt and stretching to reuse the hashes already produced.
+    """
+    cached = [] if cached is None else cached
+    workers = workers or cpu_count() or 1
+    index = 0
+    with ProcessPoolExecutor(workers) as pool:
+        while True:
+            while index < len(cached):
+                yield index, cached[index]
+                index += 1
+            starts = range(len(cached), len(cached) + chunk_size * workers, chunk_size)
+            for hashes in pool.map(
+                hash_range,
+                [salt] * workers,
+                starts,
+                [start + chunk_size for start in starts],
+                [stretched] * workers,
+            ):
+                cached.extend(hashes)
+
+
+def get_key(salt, stretched=False, hashes_from=None):
+    hashes_from = hashes_from or serial_hashes(salt, stretched)
     hashes = deque()
     while True:
         while len(hashes) <= 1000:
-            h = hashlib.md5(f'{salt}{hi}'.encode('utf-8')).hexdigest()
-            if stretched:
-                for _ in range(2016):
-                    h = hashlib.md5(f'{h}'.encode('utf-8')).hexdigest()
-            hashes.append((hi, h))
-            hi += 1
+            hashes.append(next(hashes_from))
         index, hash_val = hashes.popleft()
         triples = re.findall(r'(.)\1{2,}', hash_val)
         if len(triples) == 0:
@@ -97,6 +136,42 @@ def get_key(salt, stretched=False):
                 break
 
 
+TRIPLE = re.compile(r'(.)\1\1')
+QUINTUPLE = re.compile(r'(.)\1{4}')
+
+
+def serial_hashes(salt, stretched=False, chunk_size=1000):
+    for start in count(0, chunk_size):
+        yield from enumerate(hash_range(salt, start, start + chunk_size, stretched), start)
+
+
+def find_keys(hashes_from):
+    """
+    Same keys as get_key, but each hash is scanned once as it enters the
+    1000 hash window: its first triple is kept alongside it and the index is
+    appended to a deque per quintuple character, so checking a candidate is
+    just dropping stale indices off the front of one deque.
+    hashes_from is any iterator of (index, hash), e.g. serial_hashes or hash_stream.
+    """
+    window = deque()
+    quintuples = defaultdict(deque)
+    while True:
+        while len(window) <= 1000:
+            index, hash_val = next(hashes_from)
+            triple = TRIPLE.search(hash_val)
+            window.append((index, hash_val, triple.group(1) if triple else None))
+            for char in set(QUINTUPLE.findall(hash_val)):
+                quintuples[char].append(index)
+        index, hash_val, char_to_match = window.popleft()
+        if char_to_match is None:
+            continue
+        later = quintuples[char_to_match]
+        while later and later[0] <= index:
+            later.popleft()
+        if later and later[0] <= index + 1000:
+            yield index, hash_val
+
+
 def test_get_key():
     pad = get_key('abc')
     index, _ = next(pad)
@@ -129,3 +204,44 @@ def test_puzzle2():
     for _ in range(64):
         index, _ = next(pad)
     assert index == 22696
+
+
+def test_hash_stream():
+    stream = hash_stream('abc', chunk_size=100, workers=2)
+    assert [next(stream) for _ in range(20)][18][1] == hashlib.md5(b'abc18').hexdigest()
+    assert hash_range('abc', 0, 1, stretched=True) == ['a107ff634856bb300138cac6568c0f24']
+    cached = []
+    pad = get_key('abc', hashes_from=hash_stream('abc', cached=cached))
+    for _ in range(64):
+        index, _ = next(pad)
+    assert index == 22728
+    produced = len(cached)
+    assert produced >= 22728 + 1000
+    pad = get_key('abc', hashes_from=hash_stream('abc', cached=cached))
+    assert [next(pad)[0] for _ in range(2)] == [39, 92]
+    assert len(cached) == produced
+
+
+def test_stretched_hash_stream():
+    cached = []
+    stream = hash_stream('abc', stretched=True, chunk_size=256, workers=2, cached=cached)
+    assert next(get_key('abc', hashes_from=stream))[0] == 10
+    produced = len(cached)
+    assert cached[0] == 'a107ff634856bb300138cac6568c0f24'
+    stream = hash_stream('abc', stretched=True, chunk_size=256, workers=2, cached=cached)
+    assert next(find_keys(stream))[0] == 10
+    assert len(cached) == produced
+
+
+def test_find_keys():
+    pad = find_keys(serial_hashes('abc'))
+    assert [next(pad)[0] for _ in range(2)] == [39, 92]
+    for _ in range(62):
+        index, _ = next(pad)
+    assert index == 22728
+    pad = find_keys(serial_hashes('ahsbgdzn'))
+    for _ in range(64):
+        index, _ = next(pad)
+    assert index == 23890
+    pad = find_keys(serial_hashes('abc', stretched=True, chunk_size=256))
+    assert next(pad)[0] == 10
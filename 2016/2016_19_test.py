@@ -1,3 +1,4 @@
+from array import array
 from collections import deque
 
 class Puzzle:
@@ -81,9 +82,20 @@ def winner(size):
     return players.popleft()
 
 
+def circle_links(size):
+    """
+    Doubly linked circle of elves 1..size as array('I') next/prev tables, slot 0 unused.
+    """
+    next_player = array("I", range(1, size + 2))
+    prev_player = array("I", [0]) + array("I", range(size))
+    next_player[0] = 0
+    next_player[size] = 1
+    prev_player[1] = size
+    return next_player, prev_player
+
+
 def winner_fast(size):
-    next_player = [0 if i == 0 else i + 1 if i + 1 <= size else 1 for i in range(size+1)]
-    prev_player = [0 if i == 0 else size if i == 1 else i - 1 for i in range(size+1)]
+    next_player, prev_player = circle_links(size)
     current_player = 1
     target_player = next_player[current_player]
     while size > 1:
@@ -120,8 +132,7 @@ def winner2(size):
 
 
 def winner2_fast(size):
-    next_player = [0 if i == 0 else i + 1 if i + 1 <= size else 1 for i in range(size+1)]
-    prev_player = [0 if i == 0 else size if i == 1 else i - 1 for i in range(size+1)]
+    next_player, prev_player = circle_links(size)
     current_player = 1
     target_player = current_player + (size - 1) // 2 + ((size - 1) % 2)
     while size > 1:
@@ -145,3 +156,41 @@ def test_winner2():
     assert winner2_fast(6) == 3
     # assert winner2(3_001_330) == 1_407_007  # this was not the fastest but I let it run and finally got 1407007
     assert winner2_fast(3_001_330) == 1_407_007  # faster linked list approach
+
+
+def winner_closed_form(size):
+    # Josephus with every second elf removed: 2 * (size - 2^k) + 1 for the largest 2^k <= size
+    return 2 * (size - (1 << (size.bit_length() - 1))) + 1
+
+
+def winner2_closed_form(size):
+    power = 1
+    while power * 3 <= size:
+        power *= 3
+    if size == power:
+        return size
+    if size <= 2 * power:
+        return size - power
+    return 2 * size - 3 * power
+
+
+def cross_check(limit):
+    """
+    Sizes up to limit where a closed form disagrees with its simulator.
+    """
+    return [
+        size
+        for size in range(1, limit + 1)
+        if winner_closed_form(size) != winner_fast(size)
+        or winner2_closed_form(size) != winner2_fast(size)
+    ]
+
+
+def test_closed_forms():
+    assert cross_check(1_000) == []
+    assert winner(7) == winner_closed_form(7) == 7
+    assert winner2(7) == winner2_closed_form(7) == 5
+    assert winner_closed_form(3_001_330) == 1_808_357
+    assert winner2_closed_form(3_001_330) == 1_407_007
+    assert winner_closed_form(5_000_000_000) == 1_410_065_409
+    assert winner2_closed_form(5_000_000_000) == 1_513_215_599
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Puzzle:
     """
     --- Day 15: Dueling Generators ---
@@ -136,10 +139,67 @@ def judge(starting_a, starting_b, count, cond_a=0, cond_b=0):
     return total
 
 
+MODULUS = 2147483647
+
+
+def jump_table(factor, size):
+    """
+    factor**1 .. factor**size mod 2147483647, so one multiply of the current
+    value by the table jumps the generator ahead a whole block at once
+    (both operands are below 2**31 so products fit in int64).
+    """
+    powers = np.empty(size, dtype=np.int64)
+    powers[0] = factor
+    filled = 1
+    while filled < size:
+        step = min(filled, size - filled)
+        powers[filled : filled + step] = powers[:step] * powers[filled - 1] % MODULUS
+        filled += step
+    return powers
+
+
+def generator_blocks(factor, current, condition=0, block_size=1 << 20):
+    powers = jump_table(factor, block_size)
+    while True:
+        block = current * powers % MODULUS
+        current = int(block[-1])
+        if condition:
+            block = block[block % condition == 0]
+        yield block
+
+
+def judge_numpy(starting_a, starting_b, count, cond_a=0, cond_b=0, block_size=1 << 20):
+    blocks_a = generator_blocks(16807, starting_a, cond_a, block_size)
+    blocks_b = generator_blocks(48271, starting_b, cond_b, block_size)
+    pending_a = pending_b = np.empty(0, dtype=np.int64)
+    total = 0
+    while count > 0:
+        if len(pending_a) == 0:
+            pending_a = next(blocks_a)
+        if len(pending_b) == 0:
+            pending_b = next(blocks_b)
+        n = min(count, len(pending_a), len(pending_b))
+        total += int(np.count_nonzero((pending_a[:n] ^ pending_b[:n]) & 0xFFFF == 0))
+        pending_a, pending_b = pending_a[n:], pending_b[n:]
+        count -= n
+    return total
+
+
 def test_judge():
     assert judge(65, 8921, 2) == 0
     assert judge(65, 8921, 3) == 1
     assert judge(65, 8921, 5) == 1
 
     assert judge(618, 814, 40_000_000) == 577
-    assert judge(618, 814, 5_000_000, 4, 8) == 316
\ No newline at end of file
+    assert judge(618, 814, 5_000_000, 4, 8) == 316
+
+
+def test_judge_numpy():
+    for count in [2, 3, 5, 1_000, 20_000]:
+        assert judge_numpy(65, 8921, count, block_size=64) == judge(65, 8921, count)
+        assert judge_numpy(618, 814, count, 4, 8, block_size=64) == judge(618, 814, count, 4, 8)
+    assert judge_numpy(65, 8921, 1056, 4, 8) == 1
+    assert judge_numpy(65, 8921, 40_000_000) == 588
+    assert judge_numpy(65, 8921, 5_000_000, 4, 8) == 309
+    assert judge_numpy(618, 814, 40_000_000) == 577
+    assert judge_numpy(618, 814, 5_000_000, 4, 8) == 316
@@ -1,4 +1,6 @@
+from array import array
 from collections import deque, defaultdict
+from time import perf_counter
 
 
 class MarbleGame:
@@ -127,6 +129,53 @@ class MarbleGame:
         return max(self.player_scores)
 
 
+class MarbleRing:
+    """
+    Same game as MarbleGame but the circle is kept as parallel array('I')
+    clockwise/counter-clockwise links indexed by marble number, so each
+    placement and each scoring removal is O(1) instead of a list insert/pop.
+    """
+
+    def __init__(self, num_players, num_marbles):
+        self.num_players = num_players
+        self.num_marbles = num_marbles
+        self.player_scores = [0] * num_players
+        self.player_scores_details = None
+
+    def play(self, track_details=False):
+        num_players = self.num_players
+        last_marble = self.num_marbles
+        clockwise = array("I", bytes(4 * (last_marble + 1)))
+        counter_clockwise = array("I", bytes(4 * (last_marble + 1)))
+        scores = [0] * num_players
+        details = defaultdict(list) if track_details else None
+        current = 0
+        for marble in range(1, last_marble + 1):
+            if marble % 23 == 0:
+                for _ in range(7):
+                    current = counter_clockwise[current]
+                before = counter_clockwise[current]
+                after = clockwise[current]
+                clockwise[before] = after
+                counter_clockwise[after] = before
+                player = (marble - 1) % num_players
+                scores[player] += marble + current
+                if track_details:
+                    details[player].extend((marble, current))
+                current = after
+            else:
+                before = clockwise[current]
+                after = clockwise[before]
+                clockwise[before] = marble
+                counter_clockwise[marble] = before
+                clockwise[marble] = after
+                counter_clockwise[after] = marble
+                current = marble
+        self.player_scores = scores
+        self.player_scores_details = details
+        return max(scores)
+
+
 INPUT = [416, 71975]  # 416 players; last marble is worth 71975 points
 SAMPLES = [
     [9, 25, False, 32],
@@ -183,3 +232,23 @@ def play_game(max_players, last_marble):
 def test_play_game():
     max_players, last_marble = (416, 71975 * 100)
     assert play_game(max_players, last_marble) == 3566801385
+
+
+def test_marble_ring():
+    for num_players, last_marble, _, high_score in SAMPLES:
+        ring_game = MarbleRing(num_players, last_marble)
+        assert ring_game.play() == high_score
+        list_game = MarbleGame(num_players, last_marble)
+        list_game.play()
+        assert ring_game.player_scores == list_game.player_scores
+        ring_game.play(track_details=True)
+        assert ring_game.player_scores_details == list_game.player_scores_details
+    assert MarbleRing(416, 71975).play() == 439341
+
+
+def test_marble_ring_benchmark():
+    max_players, last_marble = (416, 71975 * 100)
+    start = perf_counter()
+    assert MarbleRing(max_players, last_marble).play() == 3566801385
+    elapsed = perf_counter() - start
+    print(f"\n{elapsed / (last_marble / 1_000_000):.3f}s per million marbles")
@@ -150,6 +150,81 @@ def get_next_gen(current_gen, rules):
     return next_gen
 
 
+class Pots:
+    """
+    Row of pots as a big-int bitset (bit k is pot offset + k, trimmed so bit 0
+    is always a plant). A generation ANDs the five shifted copies of the row
+    together for every rule in the 32-entry table that grows a plant, so the
+    whole row is updated with a handful of big-int operations.
+    """
+
+    def __init__(self, line, raw_rules):
+        alive, rules = parse_initial(line, raw_rules)
+        if "....." in rules:
+            raise ValueError("empty pots cannot grow plants in an infinite row")
+        self.table = [
+            pattern
+            for pattern in range(32)
+            if "".join("#" if pattern >> j & 1 else "." for j in range(5)) in rules
+        ]
+        self.bits = sum(1 << pot for pot in alive)
+        self.offset = 0
+        self.generation = 0
+        self.trim()
+
+    def trim(self):
+        if self.bits:
+            low = (self.bits & -self.bits).bit_length() - 1
+            self.bits >>= low
+            self.offset += low
+
+    def step(self):
+        padded = self.bits << 4
+        mask = (1 << (padded.bit_length() + 4)) - 1
+        window = [padded >> j for j in range(5)]
+        next_bits = 0
+        for pattern in self.table:
+            term = mask
+            for j in range(5):
+                term &= window[j] if pattern >> j & 1 else ~window[j]
+            next_bits |= term
+        # bit k of the result is centred on pot (offset - 4) + k + 2
+        self.bits = next_bits
+        self.offset -= 2
+        self.generation += 1
+        self.trim()
+
+    def pot_sum(self):
+        total, count, bits = 0, 0, self.bits
+        while bits:
+            low = bits & -bits
+            total += low.bit_length() - 1
+            count += 1
+            bits ^= low
+        return total + count * self.offset
+
+    def sum_after(self, generations):
+        """
+        Steps until the target generation or until the row repeats as a
+        translation of any earlier generation (a glider of some period), then
+        skips whole periods by shifting the offset and steps the remainder.
+        """
+        seen = {self.bits: (self.generation, self.offset)}
+        while self.generation < generations:
+            self.step()
+            if self.bits in seen:
+                generation, offset = seen[self.bits]
+                period = self.generation - generation
+                periods = (generations - self.generation) // period
+                self.offset += periods * (self.offset - offset)
+                self.generation += periods * period
+                break
+            seen[self.bits] = (self.generation, self.offset)
+        while self.generation < generations:
+            self.step()
+        return self.pot_sum()
+
+
 def test_next_gen():
     generation, rules = parse_initial(SAMPLE_INITIAL, SAMPLE_RULES)
     assert generation == {0, 3, 5, 8, 9, 16, 17, 18, 22, 23, 24}
@@ -186,3 +261,27 @@ def test_puzzle_next_gen():
     #    generation = get_next_gen(generation, rules)
     # assert sum(generation) == 2571
     assert slope * (50_000_000_000 - g0) + base == 3100000000655
+
+
+def test_pots():
+    pots = Pots(SAMPLE_INITIAL, SAMPLE_RULES)
+    pots.step()
+    assert pots.offset == 0 and pots.pot_sum() == sum({0, 4, 9, 15, 18, 21, 24})
+    assert Pots(SAMPLE_INITIAL, SAMPLE_RULES).sum_after(20) == 325
+    assert Pots(INPUT_INITIAL, INPUT_RULES).sum_after(20) == 2571
+    assert Pots(INPUT_INITIAL, INPUT_RULES).sum_after(50_000_000_000) == 3100000000655
+    generation, rules = parse_initial(INPUT_INITIAL, INPUT_RULES)
+    for _ in range(150):
+        generation = get_next_gen(generation, rules)
+    assert Pots(INPUT_INITIAL, INPUT_RULES).sum_after(150) == sum(generation)
+
+
+def test_pots_period_two_glider():
+    glider_rules = ["..#.. => #", ".#... => #", ".##.. => #"]
+    generation, rules = parse_initial("#", glider_rules)
+    for g in range(1, 8):
+        generation = get_next_gen(generation, rules)
+        assert Pots("#", glider_rules).sum_after(g) == sum(generation)
+    # {0} -> {0, 1} -> {1} -> {1, 2} -> ... moves one pot every two generations
+    assert Pots("#", glider_rules).sum_after(50_000_000_000) == 25_000_000_000
+    assert Pots("#", glider_rules).sum_after(50_000_000_001) == 2 * 25_000_000_000 + 1
@@ -128,3 +128,63 @@ def test_coco_score():
     # puzzle
     assert extract_range(coco_score(3, 7), 793061, 10) == '4138145721'
     assert match_sequence(coco_score(3, 7), '793061') == 20276284
+
+
+class Scoreboard:
+    """
+    Recipe scores kept one byte per digit in a bytearray, grown a batch of
+    recipes at a time, with matches found by bytearray.find over only the
+    newly appended window (plus a pattern-length overlap).
+    """
+
+    NEW_RECIPES = [bytes(int(d) for d in str(total)) for total in range(19)]
+
+    def __init__(self, elf_1_recipe=3, elf_2_recipe=7, batch_size=1 << 16):
+        self.board = bytearray([elf_1_recipe, elf_2_recipe])
+        self.elf_1 = 0
+        self.elf_2 = 1
+        self.batch_size = batch_size
+
+    def extend(self, count):
+        board = self.board
+        new_recipes = self.NEW_RECIPES
+        elf_1, elf_2 = self.elf_1, self.elf_2
+        target = len(board) + count
+        while len(board) < target:
+            score_1 = board[elf_1]
+            score_2 = board[elf_2]
+            board += new_recipes[score_1 + score_2]
+            size = len(board)
+            elf_1 = (elf_1 + 1 + score_1) % size
+            elf_2 = (elf_2 + 1 + score_2) % size
+        self.elf_1, self.elf_2 = elf_1, elf_2
+
+    def scores(self, start, length):
+        if len(self.board) < start + length:
+            self.extend(start + length - len(self.board))
+        return "".join(str(d) for d in self.board[start : start + length])
+
+    def find(self, sequence):
+        pattern = bytes(int(d) for d in sequence)
+        searched = 0
+        while True:
+            found = self.board.find(pattern, searched)
+            if found >= 0:
+                return found
+            searched = max(0, len(self.board) - len(pattern) + 1)
+            self.extend(self.batch_size)
+
+
+def test_scoreboard():
+    scoreboard = Scoreboard(3, 7)
+    assert scoreboard.scores(0, 20) == "37101012451589167792"
+    assert scoreboard.scores(9, 10) == "5158916779"
+    assert Scoreboard(batch_size=4).find("51589") == 9
+    assert Scoreboard(batch_size=4).find("01245") == 5
+    assert Scoreboard(batch_size=4).find("92510") == 18
+    assert Scoreboard(batch_size=4).find("59414") == 2018
+    # puzzle
+    scoreboard = Scoreboard(3, 7)
+    assert scoreboard.scores(793061, 10) == "4138145721"
+    assert scoreboard.find("793061") == 20276284
+    assert len(scoreboard.board) < 20276284 + 2 * scoreboard.batch_size
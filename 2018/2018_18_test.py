@@ -1,6 +1,9 @@
+from hashlib import blake2b
 from pathlib import Path
 from typing import NamedTuple
 
+import numpy as np
+
 
 class Puzzle:
     """
@@ -273,6 +276,67 @@ class Forest:
         return number_wooded * number_lumberyards
 
 
+class LumberArea:
+    """
+    Same rules as Forest on a uint8 grid (0 open, 1 trees, 2 lumberyard).
+    Neighbour counts are the sum of the eight shifted slices of a zero-padded
+    mask, and each minute's grid bytes are hashed with blake2b so a repeated
+    state gives the cycle without storing whole maps as strings.
+    """
+
+    CODES = {".": 0, "|": 1, "#": 2}
+
+    def __init__(self, raw_map):
+        self.grid = np.array(
+            [[self.CODES[c] for c in line] for line in raw_map], dtype=np.uint8
+        )
+        self.time = 0
+
+    @staticmethod
+    def neighbor_counts(mask):
+        padded = np.pad(mask.astype(np.uint8), 1)
+        rows, cols = mask.shape
+        counts = np.zeros(mask.shape, dtype=np.uint8)
+        for dy in range(3):
+            for dx in range(3):
+                if dy != 1 or dx != 1:
+                    counts += padded[dy : dy + rows, dx : dx + cols]
+        return counts
+
+    def tick(self):
+        grid = self.grid
+        trees = self.neighbor_counts(grid == 1)
+        lumberyards = self.neighbor_counts(grid == 2)
+        new_grid = grid.copy()
+        new_grid[(grid == 0) & (trees >= 3)] = 1
+        new_grid[(grid == 1) & (lumberyards >= 3)] = 2
+        new_grid[(grid == 2) & ((lumberyards == 0) | (trees == 0))] = 0
+        self.grid = new_grid
+        self.time += 1
+
+    def state_key(self):
+        return blake2b(self.grid.tobytes(), digest_size=16).digest()
+
+    def resource_value(self):
+        return int(np.count_nonzero(self.grid == 1)) * int(
+            np.count_nonzero(self.grid == 2)
+        )
+
+    def run_till(self, max_time):
+        hx = {self.state_key(): self.time}
+        values = {self.time: self.resource_value()}
+        while self.time < max_time:
+            self.tick()
+            key = self.state_key()
+            if key in hx:
+                start = hx[key]
+                period = self.time - start
+                return values[start + (max_time - start) % period]
+            hx[key] = self.time
+            values[self.time] = self.resource_value()
+        return self.resource_value()
+
+
 SAMPLE = [
     ".#.#...|#.",
     ".....#|##|",
@@ -317,3 +381,11 @@ def test_puzzle_forest2():
     assert offset == 26
     result = forest.run_till(498 + 26)  # should be same as at 1_000_000_000
     assert result == (524, 190836)
+
+
+def test_lumber_area():
+    area = LumberArea(SAMPLE)
+    assert area.run_till(10) == 1147
+    assert LumberArea(INPUTS).run_till(10) == 486878
+    assert LumberArea(INPUTS).run_till(498 + 26) == 190836
+    assert LumberArea(INPUTS).run_till(1_000_000_000) == 190836
@@ -1,3 +1,4 @@
+from array import array
 from pathlib import Path
 from typing import NamedTuple
 
@@ -346,6 +347,82 @@ class Board:
             print("".join(row))
 
 
+class SeatingEngine:
+    """
+    Seats numbered once, with the seats each one looks at (adjacent for v=0,
+    first visible in each direction for v=1) stored in CSR form: seat i's
+    neighbours are neighbors[offsets[i]:offsets[i + 1]]. Occupancy lives in a
+    bytearray alongside a running count of occupied neighbours, and a tick
+    only re-evaluates seats next to a seat that flipped in the previous tick.
+    """
+
+    def __init__(self, layout, v=0):
+        self.v = v
+        self.threshold = 4 if v == 0 else 5
+        self.max_y = len(layout)
+        self.max_x = len(layout[0])
+        self.seats = [
+            Pt(x, y)
+            for y, row in enumerate(layout)
+            for x, c in enumerate(row)
+            if c != "."
+        ]
+        index = {pt: i for i, pt in enumerate(self.seats)}
+        self.offsets = array("I", [0])
+        self.neighbors = array("I")
+        for pt in self.seats:
+            for d in Board.DELTAS:
+                seen = self.first_seat(index, pt, d)
+                if seen is not None:
+                    self.neighbors.append(seen)
+            self.offsets.append(len(self.neighbors))
+        self.occupied = bytearray(
+            1 if layout[pt.y][pt.x] == "#" else 0 for pt in self.seats
+        )
+        self.occupied_neighbors = array("I", bytes(4 * len(self.seats)))
+        for i in range(len(self.seats)):
+            if self.occupied[i]:
+                for n in self.neighbors[self.offsets[i] : self.offsets[i + 1]]:
+                    self.occupied_neighbors[n] += 1
+        self.dirty = set(range(len(self.seats)))
+        self.generations = 0
+
+    def first_seat(self, index, pt, d):
+        x, y = pt.x + d.x, pt.y + d.y
+        while 0 <= x < self.max_x and 0 <= y < self.max_y:
+            if Pt(x, y) in index:
+                return index[Pt(x, y)]
+            if self.v == 0:
+                return None
+            x, y = x + d.x, y + d.y
+        return None
+
+    def tick(self):
+        occupied, counts = self.occupied, self.occupied_neighbors
+        flips = [
+            i
+            for i in self.dirty
+            if (occupied[i] == 0 and counts[i] == 0)
+            or (occupied[i] == 1 and counts[i] >= self.threshold)
+        ]
+        self.dirty = set()
+        for i in flips:
+            occupied[i] ^= 1
+            change = 1 if occupied[i] else -1
+            neighbors = self.neighbors[self.offsets[i] : self.offsets[i + 1]]
+            for n in neighbors:
+                counts[n] += change
+            self.dirty.update(neighbors)
+            self.dirty.add(i)
+        self.generations += 1
+        return 1 if flips else 0
+
+    def run(self):
+        while self.tick() == 1:
+            pass
+        return sum(self.occupied)
+
+
 def test_sample():
     sample = Board(SAMPLE)
     sample.run()
@@ -362,3 +439,18 @@ def test_input():
     sample2 = Board(INPUT, 1)
     sample2.run()
     assert sum([v == "#" for k, v in sample2.grid.items()]) == 2027
+
+
+def test_seating_engine():
+    assert SeatingEngine(SAMPLE).run() == 37
+    assert SeatingEngine(SAMPLE, 1).run() == 26
+    assert SeatingEngine(INPUT).run() == 2243
+    assert SeatingEngine(INPUT, 1).run() == 2027
+    board = Board(SAMPLE, 1)
+    engine = SeatingEngine(SAMPLE, 1)
+    for _ in range(3):
+        board.tick()
+        engine.tick()
+    assert {pt for pt, v in board.grid.items() if v == "#"} == {
+        pt for i, pt in enumerate(engine.seats) if engine.occupied[i]
+    }
@@ -1,3 +1,7 @@
+from array import array
+from typing import NamedTuple
+
+
 class Puzzle:
     """
     --- Day 15: Rambunctious Recitation ---
@@ -89,6 +93,45 @@ def get_nth_number_in_game(n, game):
     return ans
 
 
+class GameState(NamedTuple):
+    turn: int
+    last_spoken: int
+    last_seen: array
+
+
+def start_game(starting_numbers) -> GameState:
+    size = max(starting_numbers) + 1
+    last_seen = array("I", bytes(4 * size))
+    for turn, spoken in enumerate(starting_numbers[:-1], 1):
+        last_seen[spoken] = turn
+    return GameState(len(starting_numbers), starting_numbers[-1], last_seen)
+
+
+def play_game_to(n, state: GameState) -> GameState:
+    """
+    Batch version of game_generator: last_seen is a preallocated array('I')
+    indexed by spoken number (a spoken age is always below the turn count)
+    holding the turn it was last spoken, 0 meaning never. The returned state
+    can be passed back in to resume from its turn; the passed state is copied,
+    never modified, so one checkpoint can be resumed any number of times.
+    """
+    start, last_spoken, last_seen = state
+    last_seen = array("I", last_seen)
+    if len(last_seen) < n:
+        last_seen.extend(bytes(4 * (n - len(last_seen))))
+    for turn in range(start, n):
+        previous = last_seen[last_spoken]
+        last_seen[last_spoken] = turn
+        last_spoken = turn - previous if previous else 0
+    return GameState(max(start, n), last_spoken, last_seen)
+
+
+def nth_number_in_game(n, starting_numbers):
+    if n <= len(starting_numbers):
+        return starting_numbers[n - 1]
+    return play_game_to(n, start_game(starting_numbers)).last_spoken
+
+
 def test_game():
     sample_game = game_generator(SAMPLE)
     sample_output = [next(sample_game) for r in RESULT_FROM_SAMPLE]
@@ -105,3 +148,18 @@ def test_game():
 def test_part1and2():
     assert get_nth_number_in_game(2020, game_generator([8, 13, 1, 0, 18, 9])) == 755
     assert get_nth_number_in_game(30000000, game_generator([8, 13, 1, 0, 18, 9])) == 11962
+
+
+def test_nth_number_in_game():
+    for n, expected in enumerate(RESULT_FROM_SAMPLE, 1):
+        assert nth_number_in_game(n, [0, 3, 6]) == expected
+    assert nth_number_in_game(2020, [1, 3, 2]) == 1
+    assert nth_number_in_game(2020, [3, 1, 2]) == 1836
+    checkpoint = play_game_to(2020, start_game([8, 13, 1, 0, 18, 9]))
+    assert checkpoint.turn == 2020
+    assert checkpoint.last_spoken == 755
+    assert play_game_to(3000, checkpoint).last_spoken == 65
+    assert play_game_to(3000, checkpoint).last_spoken == 65
+    assert play_game_to(2500, checkpoint).last_spoken == 286
+    assert play_game_to(30000000, checkpoint).last_spoken == 11962
+    assert nth_number_in_game(30000000, [0, 3, 6]) == 175594
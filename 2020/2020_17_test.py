@@ -1,5 +1,7 @@
-from typing import NamedTuple
 from collections import defaultdict
+from itertools import product
+
+import numpy as np
 
 
 class Puzzle:
@@ -363,41 +365,142 @@ INPUT = [
     '..#.#.##']
 
 
-class Pt(NamedTuple):
-    x: int
-    y: int
-    z: int
+class Pocket:
+    """
+    Conway cubes in any number of dimensions (x, y plus dimensions - 2 extra).
+    The start is flat in the extra dimensions so every later state is mirror
+    symmetric in each of them, and only the half-space with all extra
+    coordinates >= 0 is simulated; total() weights each cube by its number of
+    mirror images.
+
+    Small states use a dense numpy grid whose low extra-dimension edge is a
+    reflection of index 1. Once the grid would exceed dense_limit cells the
+    cubes move to a sparse set of coordinates packed into one int (BITS bits per
+    axis) with neighbour deltas precomputed per extra-coordinate class.
+    """
 
-
-class Board:
-    def __init__(self, initial_lines, active_char='#'):
-        self.grid = defaultdict(int)
-        z = 0
-        for y in range(len(initial_lines)):
-            line = initial_lines[y]
-            for x in range(len(line)):
-                if line[x] == active_char:
-                    self.grid[Pt(x, y, z)] = 1
+    BITS = 16
+    BIAS = 1 << (BITS - 1)
+
+    def __init__(
+        self, initial_lines, dimensions=3, active_char='#', dense_limit=1 << 22
+    ):
+        self.dimensions = dimensions
+        self.extra = dimensions - 2
+        self.dense_limit = dense_limit
+        self.grid = np.array(
+            [[c == active_char for c in line] for line in initial_lines], dtype=bool
+        ).T.reshape((len(initial_lines[0]), len(initial_lines)) + (1,) * self.extra)
+        self.origin = (0, 0)
+        self.active = None
+        self.deltas = {}
+
+    def pack(self, coordinates):
+        return sum(
+            (c + self.BIAS) << (self.BITS * i) for i, c in enumerate(coordinates)
+        )
+
+    def unpack(self, key):
+        mask = (1 << self.BITS) - 1
+        return tuple(
+            (key >> (self.BITS * i) & mask) - self.BIAS for i in range(self.dimensions)
+        )
 
     def total(self):
-        return sum(self.grid[pt] for pt in self.grid)
+        if self.active is None:
+            weights = np.ones((1, 1), dtype=np.int64)
+            for i in range(self.extra):
+                weights = np.multiply.outer(
+                    weights, np.where(np.arange(self.grid.shape[2 + i]) > 0, 2, 1)
+                )
+            return int((self.grid * weights).sum())
+        return sum(
+            1 << sum(1 for c in self.unpack(key)[2:] if c) for key in self.active
+        )
 
     def step(self):
+        if (
+            self.active is None
+            and np.prod(np.add(self.grid.shape, 2)) <= self.dense_limit
+        ):
+            self.step_dense()
+        else:
+            if self.active is None:
+                self.to_sparse()
+            self.step_sparse()
+
+    def step_dense(self):
+        grid = self.grid
+        padded_shape = [n + 4 for n in grid.shape[:2]] + [n + 3 for n in grid.shape[2:]]
+        padded = np.zeros(padded_shape, dtype=np.uint8)
+        padded[(slice(2, -2),) * 2 + (slice(1, -2),) * self.extra] = grid
+        for axis in range(2, self.dimensions):
+            mirror = [slice(None)] * self.dimensions
+            source = list(mirror)
+            mirror[axis], source[axis] = 0, 2
+            padded[tuple(mirror)] = padded[tuple(source)]
+        out_shape = [n + 2 for n in grid.shape[:2]] + [n + 1 for n in grid.shape[2:]]
+        counts = np.zeros(out_shape, dtype=np.int32)
+        for offset in product(range(3), repeat=self.dimensions):
+            counts += padded[tuple(slice(o, o + n) for o, n in zip(offset, out_shape))]
+        previous = padded[(slice(1, -1),) * 2 + (slice(1, -1),) * self.extra].astype(
+            bool
+        )
+        counts -= previous
+        self.grid = (counts == 3) | (previous & (counts == 2))
+        self.origin = (self.origin[0] + 1, self.origin[1] + 1)
+
+    def to_sparse(self):
+        self.active = {
+            self.pack((idx[0] - self.origin[0], idx[1] - self.origin[1], *idx[2:]))
+            for idx in map(tuple, np.argwhere(self.grid).tolist())
+        }
+        self.grid = None
+
+    def deltas_for(self, extra_classes):
+        """
+        Packed neighbour deltas with multiplicities for a cube whose extra
+        coordinates are 0, 1 or >= 2 (class 0, 1, 2): a coordinate of 1 also
+        reaches 0 from its mirror image at -1, and targets below 0 are dropped
+        as they are mirrors of targets counted elsewhere.
+        """
+        if extra_classes not in self.deltas:
+            per_axis = [{-1: 1, 0: 1, 1: 1}] * 2 + [
+                [{0: 1, 1: 1}, {-1: 2, 0: 1, 1: 1}, {-1: 1, 0: 1, 1: 1}][c]
+                for c in extra_classes
+            ]
+            deltas = defaultdict(int)
+            for combo in product(*(axis.items() for axis in per_axis)):
+                offset = sum(d << (self.BITS * i) for i, (d, _) in enumerate(combo))
+                weight = 1
+                for _, m in combo:
+                    weight *= m
+                deltas[offset] += weight
+            deltas[0] -= 1
+            self.deltas[extra_classes] = [(d, m) for d, m in deltas.items() if m]
+        return self.deltas[extra_classes]
+
+    def step_sparse(self):
         radiation = defaultdict(int)
-        for pt in self.grid:
-            for dz in range(-1, 2):
-                for dy in range(-1, 2):
-                    for dx in range(-1, 2):
-                        if not dx == dy == dz == 0:
-                            radiation[Pt(pt.x + dx, pt.y + dy, pt.z + dz)] += 1
-        next_grid = defaultdict(int)
-        horizon = set(radiation).union(set(self.grid))
-        for pt in horizon:
-            if self.grid[pt] == 1 and 2 <= radiation[pt] <= 3:
-                next_grid[pt] = 1
-            elif self.grid[pt] == 0 and radiation[pt] == 3:
-                next_grid[pt] = 1
-        self.grid = next_grid
+        for key in self.active:
+            extra_classes = tuple(min(c, 2) for c in self.unpack(key)[2:])
+            for delta, weight in self.deltas_for(extra_classes):
+                radiation[key + delta] += weight
+        self.active = {
+            key
+            for key, count in radiation.items()
+            if count == 3 or (count == 2 and key in self.active)
+        }
+
+
+class Board(Pocket):
+    def __init__(self, initial_lines, active_char='#'):
+        super().__init__(initial_lines, 3, active_char)
+
+
+class Board4(Pocket):
+    def __init__(self, initial_lines, active_char='#'):
+        super().__init__(initial_lines, 4, active_char)
 
 
 def test_board():
@@ -415,46 +518,7 @@ def test_board():
     assert game_board.total() == 353
 
 
-class P4(NamedTuple):
-    x: int
-    y: int
-    z: int
-    w: int
-
-
-class Board4:
-    def __init__(self, initial_lines, active_char='#'):
-        self.grid = defaultdict(int)
-        z, w = 0, 0
-        for y in range(len(initial_lines)):
-            line = initial_lines[y]
-            for x in range(len(line)):
-                if line[x] == active_char:
-                    self.grid[P4(x, y, z, w)] = 1
-
-    def total(self):
-        return sum(self.grid[pt] for pt in self.grid)
-
-    def step(self):
-        radiation = defaultdict(int)
-        for pt in self.grid:
-            for dw in range(-1, 2):
-                for dz in range(-1, 2):
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if not dx == dy == dz == dw == 0:
-                                radiation[P4(pt.x + dx, pt.y + dy, pt.z + dz, pt.w + dw)] += 1
-        next_grid = defaultdict(int)
-        horizon = set(radiation).union(set(self.grid))
-        for pt in horizon:
-            if self.grid[pt] == 1 and 2 <= radiation[pt] <= 3:
-                next_grid[pt] = 1
-            elif self.grid[pt] == 0 and radiation[pt] == 3:
-                next_grid[pt] = 1
-        self.grid = next_grid
-
-
-def test_board():
+def test_board4():
     sample_board = Board4(SAMPLE)
     assert sample_board.total() == 5
     sample_board.step()
@@ -467,3 +531,43 @@ def test_board():
     for _ in range(6):
         game_board.step()
     assert game_board.total() == 2472
+
+
+def test_pocket_backends():
+    for dimensions in range(2, 6):
+        dense = Pocket(INPUT, dimensions)
+        sparse = Pocket(INPUT, dimensions, dense_limit=0)
+        for _ in range(6):
+            dense.step()
+            sparse.step()
+            assert dense.active is None
+            assert dense.total() == sparse.total()
+    lit = ["#####"] * 5
+    for dimensions in (6, 7):
+        dense = Pocket(lit, dimensions)
+        sparse = Pocket(lit, dimensions, dense_limit=0)
+        for _ in range(4):
+            dense.step()
+            sparse.step()
+            assert dense.active is None
+            assert dense.total() == sparse.total()
+    switching = Pocket(SAMPLE, 4, dense_limit=2_000)
+    for _ in range(6):
+        switching.step()
+    assert switching.active is not None
+    assert switching.total() == 848
+
+
+def test_pocket_higher_dimensions():
+    pocket = Pocket(INPUT, 6)
+    for _ in range(6):
+        pocket.step()
+    six_dimensions = pocket.total()
+    pocket = Pocket(INPUT, 6, dense_limit=0)
+    for _ in range(6):
+        pocket.step()
+    assert pocket.total() == six_dimensions
+    longer = Pocket(INPUT, 3)
+    for _ in range(30):
+        longer.step()
+    assert longer.total() > 0
@@ -1,5 +1,8 @@
+from array import array
 from collections import deque
 
+import numpy as np
+
 class Puzzle:
     """
     --- Day 23: Crab Cups ---
@@ -183,6 +186,58 @@ def make_n_moves_v2(ring: list, number_of_moves: int, extend_to=0) -> list:
     return from_dict_to_list(cup_to_right, len(ring))
 
 
+def successor_table(ring: list, extend_to=0) -> array:
+    n = max(len(ring), extend_to)
+    cup_to_right = array("i", range(1, n + 1))
+    cup_to_right[n - 1] = 0
+    last_cup = ring[-1] if n == len(ring) else n - 1
+    for previous_cup, cup in zip(ring, ring[1:]):
+        cup_to_right[previous_cup] = cup
+    cup_to_right[last_cup] = ring[0]
+    if n > len(ring):
+        cup_to_right[ring[-1]] = len(ring)
+    return cup_to_right
+
+
+def ring_from_successors(cup_to_right: array, count=None, starting=0) -> array:
+    """
+    Labels (shifted back up by one) clockwise after the starting cup, as an
+    array('i') so np.frombuffer(result, dtype=np.int32) can share its memory.
+    """
+    if count is None:
+        count = len(cup_to_right) - 1
+    ring_array = array("i", bytes(4 * count))
+    next_cup = cup_to_right[starting]
+    for i in range(count):
+        ring_array[i] = next_cup + 1
+        next_cup = cup_to_right[next_cup]
+    return ring_array
+
+
+def make_n_moves_v3(ring: list, number_of_moves: int, extend_to=0) -> array:
+    """
+    Same moves as make_n_moves_v2 but the links live in a preallocated
+    array('i') successor table (4 bytes per cup) and the three picked up cups
+    are held in locals, so the move loop allocates nothing.
+    Returns the final successor table.
+    """
+    cup_to_right = successor_table(ring, extend_to)
+    n = len(cup_to_right)
+    current_cup = ring[0]
+    for _ in range(number_of_moves):
+        first = cup_to_right[current_cup]
+        second = cup_to_right[first]
+        third = cup_to_right[second]
+        cup_to_right[current_cup] = cup_to_right[third]
+        target_cup = current_cup - 1 if current_cup else n - 1
+        while target_cup == first or target_cup == second or target_cup == third:
+            target_cup = target_cup - 1 if target_cup else n - 1
+        cup_to_right[third] = cup_to_right[target_cup]
+        cup_to_right[target_cup] = first
+        current_cup = cup_to_right[current_cup]
+    return cup_to_right
+
+
 SAMPLE = [3, 8, 9, 1, 2, 5, 4, 6, 7]
 DOWN_SHIFTED_SAMPLE = [s-1 for s in SAMPLE]
 PUZZLE = [1, 6, 7, 2, 4, 8, 3, 5, 9]
@@ -209,3 +264,16 @@ def test_make_n_moves_v2():
     # print(star1)
     # print(star2)
     assert star1 * star2 == 21986479838
+
+
+def test_make_n_moves_v3():
+    cup_to_right = make_n_moves_v3(DOWN_SHIFTED_SAMPLE, 100)
+    assert list(ring_from_successors(cup_to_right)) == [6, 7, 3, 8, 4, 5, 2, 9]
+    assert list(ring_from_successors(make_n_moves_v3(DOWN_SHIFTED_SAMPLE, 10))) == [
+        9, 2, 6, 5, 8, 3, 7, 4
+    ]
+    cup_to_right = make_n_moves_v3(DOWN_SHIFTED_PUZZLE, 10_000_000, 1_000_000)
+    assert cup_to_right.itemsize * len(cup_to_right) == 4_000_000
+    final_ring = np.frombuffer(ring_from_successors(cup_to_right), dtype=np.int32)
+    assert len(final_ring) == 999_999
+    assert int(final_ring[0]) * int(final_ring[1]) == 21986479838
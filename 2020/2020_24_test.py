@@ -1,6 +1,9 @@
+import re
 from pathlib import Path
 from collections import defaultdict
 
+import numpy as np
+
 
 class Puzzle:
     """
@@ -193,6 +196,86 @@ class Board:
         self.grid = next_state
 
 
+AXIAL_STEPS = {
+    "e": (1, 0),
+    "w": (-1, 0),
+    "ne": (1, -1),
+    "sw": (-1, 1),
+    "nw": (0, -1),
+    "se": (0, 1),
+}
+
+
+def axial_tile(move_sequence):
+    counts = defaultdict(int)
+    for d in re.findall(r"ne|nw|se|sw|e|w", move_sequence):
+        counts[d] += 1
+    return (
+        sum(AXIAL_STEPS[d][0] * n for d, n in counts.items()),
+        sum(AXIAL_STEPS[d][1] * n for d, n in counts.items()),
+    )
+
+
+class LobbyFloor:
+    """
+    Black tiles in a uint8 array indexed [q, r] in axial coordinates, so the six
+    hex neighbours are the slice shifts in AXIAL_STEPS. The array keeps at least
+    one white tile of border and is padded out whenever black reaches it;
+    day counts the days evolved so far.
+    """
+
+    def __init__(self, moves, margin=8):
+        self.margin = margin
+        self.day = 0
+        flipped = defaultdict(int)
+        for move in moves:
+            if move:
+                flipped[axial_tile(move)] ^= 1
+        black = [loc for loc, v in flipped.items() if v]
+        low_q = min((q for q, _ in black), default=0)
+        low_r = min((r for _, r in black), default=0)
+        high_q = max((q for q, _ in black), default=0)
+        high_r = max((r for _, r in black), default=0)
+        self.origin = (margin - low_q, margin - low_r)
+        self.tiles = np.zeros(
+            (high_q - low_q + 2 * margin + 1, high_r - low_r + 2 * margin + 1),
+            dtype=np.uint8,
+        )
+        for q, r in black:
+            self.tiles[q + self.origin[0], r + self.origin[1]] = 1
+
+    def grow(self):
+        tiles = self.tiles
+        if tiles[0].any() or tiles[-1].any() or tiles[:, 0].any() or tiles[:, -1].any():
+            self.tiles = np.pad(tiles, self.margin)
+            self.origin = (self.origin[0] + self.margin, self.origin[1] + self.margin)
+
+    def neighbor_counts(self):
+        padded = np.pad(self.tiles, 1)
+        rows, cols = self.tiles.shape
+        counts = np.zeros(self.tiles.shape, dtype=np.uint8)
+        for dq, dr in AXIAL_STEPS.values():
+            counts += padded[1 + dq : 1 + dq + rows, 1 + dr : 1 + dr + cols]
+        return counts
+
+    def evolve(self):
+        self.grow()
+        counts = self.neighbor_counts()
+        self.tiles = ((counts == 2) | ((self.tiles == 1) & (counts == 1))).astype(
+            np.uint8
+        )
+        self.day += 1
+
+    def black_after(self, day):
+        if day < self.day:
+            raise ValueError(
+                f"floor is already at day {self.day}, cannot go back to {day}"
+            )
+        while self.day < day:
+            self.evolve()
+        return int(self.tiles.sum())
+
+
 def test_sample_board():
     sample_board = Board(SAMPLE)
     assert sum(sample_board.grid.values()) == 10
@@ -210,3 +293,21 @@ def test_puzzle_board():
     for _ in range(100):
         puzzle_board.evolve()
     assert sum(puzzle_board.grid.values()) == 4225
+
+
+def test_lobby_floor():
+    assert axial_tile("nwwswee") == (0, 0)
+    assert axial_tile("esew") == (0, 1)
+    sample_floor = LobbyFloor(SAMPLE)
+    assert sample_floor.black_after(0) == 10
+    assert sample_floor.black_after(1) == 15
+    assert sample_floor.black_after(100) == 2208
+    puzzle_floor = LobbyFloor(INPUT)
+    assert puzzle_floor.black_after(0) == 523
+    assert puzzle_floor.black_after(100) == 4225
+    board = Board(INPUT)
+    floor = LobbyFloor(INPUT)
+    for _ in range(10):
+        board.evolve()
+    assert floor.black_after(10) == sum(board.grid.values())
+    assert floor.black_after(1000) > 0
@@ -1,5 +1,7 @@
 from typing import NamedTuple
 
+import numpy as np
+
 
 class Pt(NamedTuple):
     x: int
@@ -480,6 +482,47 @@ class Octogrid:
         return len(reset)
 
 
+class FlashGrid:
+    """
+    Octogrid on a numpy array with a one cell border: each round of the
+    cascade adds the octopuses that newly went over 9 into the eight shifted
+    views of the padded levels, until no new ones appear. flashes_per_step
+    records the count for every step.
+    """
+
+    def __init__(self, starting_levels):
+        levels = np.array([[int(l) for l in row] for row in starting_levels], dtype=np.int32)
+        self.padded = np.pad(levels, 1)
+        self.level = self.padded[1:-1, 1:-1]
+        self.flashes_per_step = []
+
+    def step(self):
+        rows, cols = self.level.shape
+        self.level += 1
+        flashed = np.zeros(self.level.shape, dtype=bool)
+        new_flashes = self.level > 9
+        while new_flashes.any():
+            flashed |= new_flashes
+            for dy in range(3):
+                for dx in range(3):
+                    if dy != 1 or dx != 1:
+                        self.padded[dy:dy + rows, dx:dx + cols] += new_flashes
+            new_flashes = (self.level > 9) & ~flashed
+        self.level[flashed] = 0
+        self.padded[[0, -1], :] = 0
+        self.padded[:, [0, -1]] = 0
+        self.flashes_per_step.append(int(np.count_nonzero(flashed)))
+        return self.flashes_per_step[-1]
+
+    def run(self, number_steps):
+        return sum(self.step() for _ in range(number_steps))
+
+    def run_to_sync(self):
+        while self.step() < self.level.size:
+            pass
+        return len(self.flashes_per_step)
+
+
 def test_octogrid():
     sample_octogrid = Octogrid(SAMPLE)
     assert sample_octogrid.step() == 9
@@ -493,3 +536,18 @@ def test_octogrid():
     assert sample2_octogrid.run_to_sync() == 195
     puzzle_octogrid = Octogrid(INPUT)
     assert puzzle_octogrid.run_to_sync() == 212
+
+
+def test_flash_grid():
+    sample_grid = FlashGrid(SAMPLE)
+    assert sample_grid.step() == 9
+    assert sample_grid.step() == 0
+    assert FlashGrid(SAMPLE2).run(100) == 1656
+    puzzle_grid = FlashGrid(INPUT)
+    assert puzzle_grid.run(100) == 1755
+    assert len(puzzle_grid.flashes_per_step) == 100
+    assert FlashGrid(SAMPLE2).run_to_sync() == 195
+    assert FlashGrid(INPUT).run_to_sync() == 212
+    large_grid = FlashGrid([row * 5 for row in INPUT] * 5)
+    large_grid.run(1_000)
+    assert len(large_grid.flashes_per_step) == 1_000
@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import NamedTuple
 from collections import defaultdict
 
+import numpy as np
+
 
 class Pt(NamedTuple):
     x: int
@@ -222,6 +224,44 @@ class Image:
         return "\n".join(result)
 
 
+class FastImage:
+    """
+    Whole-image enhancement: the 9-bit index of every output pixel is built from
+    nine shifted slices of the padded pixel array and looked up in the 512-entry
+    algorithm at once. Everything outside the array is the scalar background.
+    """
+
+    def __init__(self, raw_string):
+        raw_enhance, raw_grid = raw_string.split("\n\n")
+        self.algorithm = np.array([c == "#" for c in raw_enhance], dtype=np.uint16)
+        self.pixels = np.array(
+            [[c == "#" for c in line] for line in raw_grid.split("\n") if line],
+            dtype=np.uint16,
+        )
+        self.background = 0
+
+    def enhance_image(self):
+        padded = np.pad(self.pixels, 2, constant_values=self.background)
+        height, width = padded.shape
+        index = np.zeros((height - 2, width - 2), dtype=np.uint16)
+        for dy in range(3):
+            for dx in range(3):
+                index <<= 1
+                index |= padded[dy : dy + height - 2, dx : dx + width - 2]
+        self.pixels = self.algorithm[index]
+        self.background = int(self.algorithm[511 if self.background else 0])
+
+    def enhance_times(self, rounds):
+        for _ in range(rounds):
+            self.enhance_image()
+        return self.lit()
+
+    def lit(self):
+        if self.background:
+            return float("inf")
+        return int(self.pixels.sum())
+
+
 def test_image():
     sample = Image(RAW_SAMPLE)
     print("\nFIRST ENHANCE\n")
@@ -246,3 +286,14 @@ def test_my_image():
     for _ in range(50 - 2):
         my_image.enhance_image()
     assert sum(my_image.grid.values()) == 18806
+
+
+def test_fast_image():
+    sample = FastImage(RAW_SAMPLE)
+    assert sample.enhance_times(2) == 35
+    assert sample.enhance_times(48) == 3351
+    my_image = FastImage(RAW_INPUT)
+    assert my_image.enhance_times(1) == float("inf")
+    assert my_image.enhance_times(1) == 5203
+    assert my_image.enhance_times(48) == 18806
+    assert my_image.enhance_times(150) > 0
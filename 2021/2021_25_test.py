@@ -407,9 +407,98 @@ class SeaFloor:
         return n + 1
 
 
+class HerdFloor:
+    """
+    Both herds as big-int bitmasks over the whole floor, bit y * width + x.
+    A herd moves by shifting its mask one column (or row) with the last
+    column (or row) wrapped back around, so each half step is a few int ops.
+    """
+
+    def __init__(self, raw_map):
+        lines = [line for line in raw_map.split("\n") if line]
+        self.height, self.width = len(lines), len(lines[0])
+        self.east = self.south = 0
+        for y, line in enumerate(lines):
+            for x, c in enumerate(line):
+                if c == ">":
+                    self.east |= 1 << (y * self.width + x)
+                elif c == "v":
+                    self.south |= 1 << (y * self.width + x)
+        row = (1 << self.width) - 1
+        self.full = (1 << (self.width * self.height)) - 1
+        self.first_col = sum(1 << (y * self.width) for y in range(self.height))
+        self.last_col = self.first_col << (self.width - 1)
+        self.last_row = row << (self.width * (self.height - 1))
+        self.moves = []
+
+    def to_east(self, mask):
+        return ((mask & ~self.last_col) << 1) | (
+            (mask & self.last_col) >> (self.width - 1)
+        )
+
+    def from_east(self, mask):
+        return ((mask & ~self.first_col) >> 1) | (
+            (mask & self.first_col) << (self.width - 1)
+        )
+
+    def to_south(self, mask):
+        return ((mask & ~self.last_row) << self.width) | (
+            (mask & self.last_row) >> (self.width * (self.height - 1))
+        )
+
+    def from_south(self, mask):
+        return (mask >> self.width) | (
+            (mask & ((1 << self.width) - 1)) << (self.width * (self.height - 1))
+        )
+
+    def step(self):
+        free = self.full & ~(self.east | self.south)
+        east_movers = self.east & self.from_east(free)
+        self.east ^= east_movers | self.to_east(east_movers)
+        free = self.full & ~(self.east | self.south)
+        south_movers = self.south & self.from_south(free)
+        self.south ^= south_movers | self.to_south(south_movers)
+        moved = east_movers.bit_count() + south_movers.bit_count()
+        self.moves.append(moved)
+        return moved
+
+    def run(self):
+        while self.step():
+            pass
+        return len(self.moves)
+
+    def render(self):
+        image = []
+        for y in range(self.height):
+            line = []
+            for x in range(self.width):
+                bit = 1 << (y * self.width + x)
+                line.append(
+                    ">" if self.east & bit else "v" if self.south & bit else "."
+                )
+            image.append("".join(line))
+        return "\n".join(image)
+
+
 def test_run_time():
     sample = SeaFloor(RAW_SAMPLE)
     assert sample.run() == 58
 
     my_map = SeaFloor(RAW_INPUT)
     assert my_map.run() == 400
+
+
+def test_herd_floor():
+    sample = HerdFloor(RAW_SAMPLE)
+    sea_floor = SeaFloor(RAW_SAMPLE)
+    for _ in range(5):
+        sample.step()
+        sea_floor.step()
+    assert sample.render() == "\n".join(
+        "".join(sea_floor.map[Pt(x, y)] for x in range(sample.width))
+        for y in range(sample.height)
+    )
+    assert HerdFloor(RAW_SAMPLE).run() == 58
+    my_map = HerdFloor(RAW_INPUT)
+    assert my_map.run() == 400
+    assert my_map.moves[-1] == 0 and all(my_map.moves[:-1])
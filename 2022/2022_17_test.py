@@ -583,6 +583,99 @@ class Board:
         return image
 
 
+ROCK_MASKS = [
+    (0b0011110,),
+    (0b0001000, 0b0011100, 0b0001000),
+    (0b0011100, 0b0000100, 0b0000100),
+    (0b0010000, 0b0010000, 0b0010000, 0b0010000),
+    (0b0011000, 0b0011000),
+]
+
+
+class Chamber:
+    """
+    Chamber as 7-bit row masks in a bytearray (bit 6 is the left wall side)
+    with each rock a stack of row masks from the bottom up, so a push is a
+    shift and a collision is an AND against the rows it overlaps. Only the
+    top window rows are kept (base counts the rows dropped below them), and
+    a cycle is found by keying on rock index, jet index and the top
+    profile_rows rows, which makes the height for any rock count exact.
+    """
+
+    def __init__(self, winds: str, window=4096, profile_rows=64) -> None:
+        self.winds = winds.strip()
+        self.wind_index = 0
+        self.rock_index = 0
+        self.rows = bytearray()
+        self.base = 0
+        self.window = window
+        self.profile_rows = profile_rows
+
+    def height(self):
+        return self.base + len(self.rows)
+
+    def collides(self, rock, y):
+        rows = self.rows
+        offset = y - self.base
+        if offset < 0:
+            raise RuntimeError("rock fell below the kept window of rows")
+        for k, mask in enumerate(rock):
+            if offset + k < len(rows) and rows[offset + k] & mask:
+                return True
+        return False
+
+    def drop(self):
+        rock = ROCK_MASKS[self.rock_index]
+        self.rock_index = (self.rock_index + 1) % len(ROCK_MASKS)
+        y = self.height() + 3
+        while True:
+            wind = self.winds[self.wind_index]
+            self.wind_index = (self.wind_index + 1) % len(self.winds)
+            if wind == "<":
+                if not any(mask & 0b1000000 for mask in rock):
+                    pushed = tuple(mask << 1 for mask in rock)
+                    if not self.collides(pushed, y):
+                        rock = pushed
+            elif not any(mask & 1 for mask in rock):
+                pushed = tuple(mask >> 1 for mask in rock)
+                if not self.collides(pushed, y):
+                    rock = pushed
+            if y == 0 or self.collides(rock, y - 1):
+                break
+            y -= 1
+        offset = y - self.base
+        for k, mask in enumerate(rock):
+            if offset + k >= len(self.rows):
+                self.rows.append(0)
+            self.rows[offset + k] |= mask
+        if len(self.rows) > 2 * self.window:
+            drop = len(self.rows) - self.window
+            del self.rows[:drop]
+            self.base += drop
+
+    def height_after(self, rocks):
+        seen = {}
+        dropped = 0
+        while dropped < rocks:
+            key = (
+                self.rock_index,
+                self.wind_index,
+                bytes(self.rows[-self.profile_rows :]),
+            )
+            if key in seen:
+                earlier_rocks, earlier_height = seen[key]
+                period = dropped - earlier_rocks
+                cycles = (rocks - dropped) // period
+                skipped = cycles * (self.height() - earlier_height)
+                for _ in range((rocks - dropped) % period):
+                    self.drop()
+                return self.height() + skipped
+            seen[key] = (dropped, self.height())
+            self.drop()
+            dropped += 1
+        return self.height()
+
+
 SAMPLE = ">>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>"
 
 
@@ -617,3 +710,22 @@ def test_my_board():
     for _ in range(5_000):
         my_board.add_next()
     assert my_board.fit_history(1000000000000) == {1565517241382 + 1}
+
+
+def test_chamber():
+    sample = Chamber(SAMPLE)
+    heights = []
+    for _ in range(3):
+        sample.drop()
+        heights.append(sample.height())
+    assert heights == [1, 4, 6]
+    assert Chamber(SAMPLE).height_after(2022) == 3068
+    assert Chamber(SAMPLE).height_after(1000000000000) == 1514285714288
+    assert Chamber(MY_INPUT).height_after(2022) == 3177
+    assert Chamber(MY_INPUT).height_after(1000000000000) == 1565517241382
+    small_window, full = Chamber(MY_INPUT, window=128), Chamber(MY_INPUT, window=10**6)
+    for _ in range(10_000):
+        small_window.drop()
+        full.drop()
+    assert small_window.height() == full.height()
+    assert len(small_window.rows) <= 2 * 128
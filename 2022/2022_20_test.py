@@ -1,5 +1,7 @@
 from pathlib import Path
 from collections import deque
+from math import isqrt
+from random import Random
 
 
 class Puzzle:
@@ -168,6 +170,76 @@ class CoordinateFile:
         return sum(self.processed[n % modulus][1] for n in [1000, 2000, 3000])
 
 
+class MixingSequence:
+    """
+    Order-statistic list for mixing: the sequence of original indices is cut
+    into blocks of about sqrt(n) entries and block_of records which block each
+    original index sits in, so finding, removing and re-inserting an element
+    costs O(sqrt(n)) rather than spinning a deque all the way round.
+    """
+
+    def __init__(self, values, block_size=None) -> None:
+        self.values = list(values)
+        self.block_size = block_size or max(16, isqrt(len(self.values)))
+        self.blocks = []
+        self.block_of = []
+        self.rebuild(range(len(self.values)))
+
+    def rebuild(self, order) -> None:
+        order = list(order)
+        size = self.block_size
+        self.blocks = [order[i : i + size] for i in range(0, len(order), size)]
+        self.block_of = [0] * len(order)
+        for b, block in enumerate(self.blocks):
+            for index in block:
+                self.block_of[index] = b
+
+    def order(self):
+        return [index for block in self.blocks for index in block]
+
+    def __iter__(self):
+        return (self.values[index] for block in self.blocks for index in block)
+
+    def position(self, index) -> int:
+        b = self.block_of[index]
+        return sum(len(block) for block in self.blocks[:b]) + self.blocks[b].index(
+            index
+        )
+
+    def insert(self, position, index) -> None:
+        for b, block in enumerate(self.blocks):
+            if position <= len(block):
+                block.insert(position, index)
+                self.block_of[index] = b
+                if len(block) > 2 * self.block_size:
+                    self.rebuild(self.order())
+                return
+            position -= len(block)
+
+    def move(self, index) -> None:
+        position = self.position(index)
+        self.blocks[self.block_of[index]].remove(index)
+        self.insert((position + self.values[index]) % (len(self.values) - 1), index)
+
+    def mix(self, levels=1) -> None:
+        for _ in range(levels):
+            for index in range(len(self.values)):
+                self.move(index)
+            self.rebuild(self.order())
+
+    def get_groove_coordinates(self):
+        mixed = list(self)
+        zero = mixed.index(0)
+        return sum(mixed[(zero + n) % len(mixed)] for n in [1000, 2000, 3000])
+
+
+class FastCoordinateFile(MixingSequence):
+    def __init__(self, raw_encrypted, decryption_key=1, levels=1) -> None:
+        super().__init__(v * decryption_key for v in raw_encrypted)
+        self.raw_encrypted = raw_encrypted
+        self.mix(levels)
+
+
 def test_coordinate_file():
     sample = CoordinateFile(SAMPLE)
     assert sample.get_groove_coordinates() == 3
@@ -180,3 +252,26 @@ def test_coordinate_file():
     assert my_input.get_groove_coordinates() == 3466
     my_input = CoordinateFile(MY_INPUT, decryption_key=811589153, levels=10)
     assert my_input.get_groove_coordinates() == 9995532008348
+
+
+def test_fast_coordinate_file():
+    sample = FastCoordinateFile(SAMPLE)
+    assert sample.get_groove_coordinates() == 3
+    sample = FastCoordinateFile(SAMPLE, decryption_key=811589153, levels=10)
+    assert sample.get_groove_coordinates() == 1623178306
+    my_input = FastCoordinateFile(MY_INPUT)
+    assert my_input.get_groove_coordinates() == 3466
+    my_input = FastCoordinateFile(MY_INPUT, decryption_key=811589153, levels=10)
+    assert my_input.get_groove_coordinates() == 9995532008348
+
+
+def test_mixing_sequence_matches_deque():
+    rng = Random(2022)
+    values = [rng.randint(-5000, 5000) for _ in range(400)] + [0]
+    fast = MixingSequence(values, block_size=7)
+    fast.mix(3)
+    slow = CoordinateFile(values, levels=3)
+    fast_values = list(fast)
+    zero = fast_values.index(0)
+    assert fast_values[zero:] + fast_values[:zero] == [v for _, v in slow.processed]
+    assert fast.get_groove_coordinates() == slow.get_groove_coordinates()
@@ -434,6 +434,117 @@ class Diffusion:
         return rl * rw - len(self.board)
 
 
+class RowDiffusion:
+    """
+    Same process as Diffusion with each row of elves held as one int (bit x is
+    column x + x0). Blocked directions for a whole row come from shifts of the
+    rows above and below, and since only elves proposing opposite moves (N/S
+    or W/E) can ever pick the same tile, collisions are the AND of those two
+    target masks. A blank row is kept above and below and bit 0 is kept clear,
+    so the board only grows when an elf reaches an edge.
+    """
+
+    def __init__(self, map: List[str]) -> None:
+        self.rows = [0]
+        for row in map:
+            self.rows.append(sum(1 << (x + 1) for x, c in enumerate(row) if c == "#"))
+        self.rows.append(0)
+        self.x0 = -1
+        self.y0 = -1
+        self.move_order = "NSWE"
+        self.moves = 0
+
+    def elves(self) -> Set[Pt]:
+        return {
+            Pt(x + self.x0, y + self.y0)
+            for y, row in enumerate(self.rows)
+            for x in range(row.bit_length())
+            if row >> x & 1
+        }
+
+    def step_to_stable(self):
+        n = 1
+        while self.step():
+            n += 1
+        return n
+
+    def step(self) -> bool:
+        rows = self.rows
+        height = len(rows)
+        proposals = {d: [0] * height for d in "NSWE"}
+        stay = [0] * height
+        for y in range(1, height - 1):
+            row = rows[y]
+            if not row:
+                continue
+            above, below = rows[y - 1], rows[y + 1]
+            column = above | row | below
+            blocked = {
+                "N": above | above << 1 | above >> 1,
+                "S": below | below << 1 | below >> 1,
+                "W": column << 1,
+                "E": column >> 1,
+            }
+            remaining = row & (blocked["N"] | blocked["S"] | row << 1 | row >> 1)
+            stay[y] = row & ~remaining
+            for d in self.move_order:
+                proposals[d][y] = remaining & ~blocked[d]
+                remaining &= blocked[d]
+            stay[y] |= remaining
+
+        north, south = proposals["N"], proposals["S"]
+        west, east = proposals["W"], proposals["E"]
+        next_rows = list(stay)
+        reached = 0
+        for y in range(height):
+            from_south = north[y + 1] if y + 1 < height else 0
+            from_north = south[y - 1] if y > 0 else 0
+            from_east = west[y] >> 1
+            from_west = east[y] << 1
+            vertical_clash = from_south & from_north
+            horizontal_clash = from_east & from_west
+            arrived = (from_south ^ from_north) | (from_east ^ from_west)
+            reached |= arrived
+            next_rows[y] |= arrived | horizontal_clash << 1 | horizontal_clash >> 1
+            if vertical_clash:
+                next_rows[y + 1] |= vertical_clash
+                next_rows[y - 1] |= vertical_clash
+        self.rows = next_rows
+        self.grow(reached)
+        self.move_order = f"{self.move_order[1:]}{self.move_order[0]}"
+        self.moves += 1
+        return bool(reached)
+
+    def grow(self, reached):
+        """
+        Only elves that moved can have reached an edge, so reached (the OR of
+        every row's arrivals) is enough to tell when bit 0 has been filled.
+        """
+        if self.rows[0]:
+            self.rows.insert(0, 0)
+            self.y0 -= 1
+        if self.rows[-1]:
+            self.rows.append(0)
+        if reached & 1:
+            self.rows = [row << 32 for row in self.rows]
+            self.x0 -= 32
+
+    def bound(self) -> Box:
+        filled = [y for y, row in enumerate(self.rows) if row]
+        low = min((row & -row).bit_length() - 1 for row in self.rows if row)
+        high = max(row.bit_length() - 1 for row in self.rows)
+        return Box(
+            Pt(low + self.x0, filled[0] + self.y0),
+            Pt(high + self.x0, filled[-1] + self.y0),
+        )
+
+    def empty_region(self):
+        bound_box = self.bound()
+        rl = bound_box.max.x - bound_box.min.x + 1
+        rw = bound_box.max.y - bound_box.min.y + 1
+        return rl * rw - sum(bin(row).count("1") for row in self.rows)
+
+
 def test_sample_diffusion():
     my_bound = bound({Pt(-2, 0), Pt(3, 0), Pt(0, 5)})
     assert my_bound == Box(Pt(-2, 0), Pt(3, 5))
@@ -459,3 +570,21 @@ def test_my_diffusion():
     assert my_diffusion.empty_region() == 3862
     my_diffusion = Diffusion(MY_MAP)
     assert my_diffusion.step_to_stable() == 913
+
+
+def test_row_diffusion():
+    sample = RowDiffusion(SAMPLE_MAP)
+    slow = Diffusion(SAMPLE_MAP)
+    assert sample.elves() == slow.board
+    assert sample.empty_region() == 27
+    for _ in range(10):
+        sample.step()
+        slow.step()
+        assert sample.elves() == slow.board
+    assert sample.empty_region() == 110
+    assert RowDiffusion(SAMPLE_MAP).step_to_stable() == 20
+    my_diffusion = RowDiffusion(MY_MAP)
+    for _ in range(10):
+        my_diffusion.step()
+    assert my_diffusion.empty_region() == 3862
+    assert RowDiffusion(MY_MAP).step_to_stable() == 913
@@ -1,3 +1,4 @@
+from hashlib import blake2b
 from pathlib import Path
 from collections import defaultdict
 
@@ -254,6 +255,80 @@ class Dish:
         print("\n".join(lines))
 
 
+class SegmentDish:
+    """
+    Dish as a flat bytearray with the runs between cube rocks precomputed as
+    slices for every row and column. A tilt counts the round rocks in each run
+    and refills it with that many rocks packed at the tilted end, and each
+    cycle's grid is hashed to a 64-bit key to find the loop.
+    """
+
+    def __init__(self, raw_map) -> None:
+        lines = [line.strip() for line in raw_map if line.strip()]
+        self.height = len(lines)
+        self.width = len(lines[0])
+        self.grid = bytearray("".join(lines), "ascii")
+        self.columns = []
+        for x in range(self.width):
+            self.columns.extend(self.segments(x, self.width, self.height))
+        self.rows = []
+        for y in range(self.height):
+            self.rows.extend(self.segments(y * self.width, 1, self.width))
+
+    def segments(self, start, step, length):
+        runs = []
+        run_start = 0
+        for i in range(length + 1):
+            if i == length or self.grid[start + i * step] == ord("#"):
+                if i > run_start:
+                    runs.append(
+                        (
+                            slice(start + run_start * step, start + i * step, step),
+                            i - run_start,
+                        )
+                    )
+                run_start = i + 1
+        return runs
+
+    def tilt(self, segments, toward_start):
+        grid = self.grid
+        for run, length in segments:
+            rocks = grid[run].count(b"O")
+            if toward_start:
+                grid[run] = b"O" * rocks + b"." * (length - rocks)
+            else:
+                grid[run] = b"." * (length - rocks) + b"O" * rocks
+
+    def cycle(self):
+        self.tilt(self.columns, True)
+        self.tilt(self.rows, True)
+        self.tilt(self.columns, False)
+        self.tilt(self.rows, False)
+
+    def load(self):
+        return sum(
+            self.grid[y * self.width : (y + 1) * self.width].count(b"O")
+            * (self.height - y)
+            for y in range(self.height)
+        )
+
+    def key(self):
+        return int.from_bytes(blake2b(self.grid, digest_size=8).digest(), "little")
+
+    def spin(self, cycles=1000000000):
+        history = {self.key(): 0}
+        loads = [self.load()]
+        for cycle in range(1, cycles + 1):
+            self.cycle()
+            key = self.key()
+            if key in history:
+                start = history[key]
+                return loads[start + (cycles - start) % (cycle - start)]
+            history[key] = cycle
+            loads.append(self.load())
+        return loads[-1]
+
+
 def test_dish():
     sample_dish = Dish(RAW_SAMPLES)
     load, _ = sample_dish.tilt(0, -1)
@@ -265,3 +340,15 @@ def test_dish():
     assert load == 109596
     load, _ = my_dish.spin()
     assert load == 96105
+
+
+def test_segment_dish():
+    sample_dish = SegmentDish(RAW_SAMPLES)
+    sample_dish.tilt(sample_dish.columns, True)
+    assert sample_dish.load() == 136
+    assert SegmentDish(RAW_SAMPLES).spin() == 64
+    assert SegmentDish(RAW_SAMPLES).spin(3) == Dish(RAW_SAMPLES).spin(3)[0]
+    my_dish = SegmentDish(RAW_INPUT)
+    my_dish.tilt(my_dish.columns, True)
+    assert my_dish.load() == 109596
+    assert SegmentDish(RAW_INPUT).spin() == 96105
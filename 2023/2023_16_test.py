@@ -260,6 +260,97 @@ class Lava:
         return max(self.shine_light(p, v) for p, v in positions)
 
 
+class SegmentLava(Lava):
+    """
+    Lava with the contraption compressed into a graph of straight beam
+    segments: a segment starts on a tile heading in a direction and covers
+    every tile up to and including the next mirror or splitter, whose outgoing
+    directions start the successor segments. Cycles of segments are collapsed
+    into strongly connected components and, in Tarjan's finishing order, each
+    component's energized tiles become one bitset, so every entry point is a
+    cached lookup instead of a fresh trace.
+    """
+
+    def __init__(self, raw_mirrors) -> None:
+        super().__init__(raw_mirrors)
+        self.width = self.x_max + 1
+        self.tiles = {}
+        self.successors = {}
+        self.energized = {}
+
+    def in_bounds(self, position):
+        return 0 <= position.x <= self.x_max and 0 <= position.y <= self.y_max
+
+    def segment(self, start, direction):
+        key = (start, direction)
+        if key not in self.tiles:
+            position, tiles = start, 0
+            while True:
+                tiles |= 1 << (position.y * self.width + position.x)
+                if position in self.mirrors:
+                    break
+                position += direction
+                if not self.in_bounds(position):
+                    break
+            self.tiles[key] = tiles
+            successors = []
+            if position in self.mirrors:
+                for new_direction in MIRROR_MAP[self.mirrors[position]][direction]:
+                    if self.in_bounds(position + new_direction):
+                        successors.append((position + new_direction, new_direction))
+            self.successors[key] = successors
+        return key
+
+    def collapse(self, root):
+        """
+        Iterative Tarjan from root, filling energized for every segment
+        reachable from it.
+        """
+        index, low, on_stack, stack = {}, {}, set(), []
+        work = [(root, 0)]
+        while work:
+            node, child = work.pop()
+            if child == 0:
+                index[node] = low[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+            successors = self.successors[node]
+            if child < len(successors):
+                work.append((node, child + 1))
+                successor = self.segment(*successors[child])
+                if successor in self.energized:
+                    continue
+                if successor not in index:
+                    work.append((successor, 0))
+                elif successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+                continue
+            for successor in successors:
+                if successor in on_stack:
+                    low[node] = min(low[node], low[successor])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                tiles = 0
+                for member in component:
+                    tiles |= self.tiles[member]
+                    for successor in self.successors[member]:
+                        tiles |= self.energized.get(successor, 0)
+                for member in component:
+                    self.energized[member] = tiles
+
+    def shine_light(self, start=Pt(0, 0), direction=Pt(1, 0)):
+        key = self.segment(start, direction)
+        if key not in self.energized:
+            self.collapse(key)
+        return bin(self.energized[key]).count("1")
+
+
 def test_lava():
     my_sample = Lava(RAW_SAMPLE)
     assert my_sample.shine_light() == 46
@@ -268,3 +359,13 @@ def test_lava():
     my_input = Lava(RAW_INPUT)
     assert my_input.shine_light() == 7884
     assert my_input.all_around() == 8185
+
+
+def test_segment_lava():
+    my_sample = SegmentLava(RAW_SAMPLE)
+    assert my_sample.shine_light() == 46
+    assert my_sample.all_around() == 51
+
+    my_input = SegmentLava(RAW_INPUT)
+    assert my_input.shine_light() == 7884
+    assert my_input.all_around() == 8185
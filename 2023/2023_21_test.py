@@ -1,3 +1,4 @@
+from collections import deque
 from pathlib import Path
 from typing import NamedTuple
 
@@ -266,6 +267,122 @@ class Garden:
         return len(even_odd[generations % 2])
 
 
+class TileGarden:
+    """
+    Infinite garden counted tile by tile instead of stepping a frontier.
+    With the start in the middle of a square tile and its row, column and the
+    tile border all open, a copy of the tile is first entered at an edge
+    midpoint (straight out from the start) or at a corner (diagonally), so one
+    BFS from the start and from each of those eight entry points gives every
+    tile's distances as entry step + distance inside the tile. Tiles whose
+    remaining steps cover the whole tile only depend on parity and are summed
+    in closed form, leaving only the few partially reached tiles per direction.
+    """
+
+    def __init__(self, raw_map) -> None:
+        self.rows = [row for row in raw_map if row]
+        self.size = len(self.rows)
+        if any(len(row) != self.size for row in self.rows):
+            raise ValueError("garden tile must be square")
+        half = self.size // 2
+        if self.rows[half][half] != "S":
+            raise ValueError("start must be in the middle of the tile")
+        lines = [self.rows[half], [row[half] for row in self.rows]]
+        lines += [self.rows[0], self.rows[-1]]
+        lines += [[row[0] for row in self.rows], [row[-1] for row in self.rows]]
+        if any("#" in line for line in lines):
+            raise ValueError("start row, start column and tile border must be open")
+        last = self.size - 1
+        self.center = self.parity_counts((half, half))
+        self.edges = [
+            self.parity_counts(entry)
+            for entry in [(0, half), (last, half), (half, 0), (half, last)]
+        ]
+        self.corners = [
+            self.parity_counts(entry)
+            for entry in [(0, 0), (0, last), (last, 0), (last, last)]
+        ]
+
+    def distances(self, entry):
+        distance = {entry: 0}
+        queue = deque([entry])
+        while queue:
+            x, y = queue.popleft()
+            for nx, ny in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+                if (
+                    0 <= nx < self.size
+                    and 0 <= ny < self.size
+                    and self.rows[ny][nx] != "#"
+                    and (nx, ny) not in distance
+                ):
+                    distance[(nx, ny)] = distance[(x, y)] + 1
+                    queue.append((nx, ny))
+        return distance.values()
+
+    def parity_counts(self, entry):
+        """
+        counts[r] is the number of plots at most r steps from entry with the
+        same parity as r; anything past the end is the whole tile.
+        """
+        distances = list(self.distances(entry))
+        furthest = max(distances)
+        histogram = [0] * (furthest + 1)
+        for d in distances:
+            histogram[d] += 1
+        counts = histogram[:2] + [0] * (furthest - 1)
+        for r in range(2, furthest + 1):
+            counts[r] = counts[r - 2] + histogram[r]
+        return counts[: furthest + 1]
+
+    @staticmethod
+    def reached(counts, remaining):
+        if remaining < 0:
+            return 0
+        if remaining < len(counts):
+            return counts[remaining]
+        furthest = len(counts) - 1
+        return counts[furthest if (furthest - remaining) % 2 == 0 else furthest - 1]
+
+    def ring_sum(self, counts, remaining, weighted):
+        """
+        Sum over tiles k = 0, 1, ... entered with remaining - k * size steps
+        left, with k + 1 tiles per k when weighted (a quadrant) or 1 (an axis).
+        """
+        furthest = len(counts) - 1
+        last_full = (remaining - furthest) // self.size if remaining >= furthest else -1
+        total = 0
+        for parity in range(2):
+            tiles = self.tiles_with_parity(last_full, parity, weighted)
+            if tiles:
+                total += tiles * self.reached(counts, remaining - parity * self.size)
+        k = last_full + 1
+        while remaining - k * self.size >= 0:
+            tiles = k + 1 if weighted else 1
+            total += tiles * self.reached(counts, remaining - k * self.size)
+            k += 1
+        return total
+
+    def tiles_with_parity(self, last, parity, weighted):
+        if self.size % 2 == 0:
+            ks = range(0, last + 1) if parity == 0 else range(0)
+        else:
+            ks = range(parity, last + 1, 2)
+        if not ks:
+            return 0
+        if not weighted:
+            return len(ks)
+        return len(ks) * (ks[0] + ks[-1]) // 2 + len(ks)
+
+    def plots(self, steps):
+        half = self.size // 2
+        total = self.reached(self.center, steps)
+        for counts in self.edges:
+            total += self.ring_sum(counts, steps - (half + 1), False)
+        for counts in self.corners:
+            total += self.ring_sum(counts, steps - 2 * (half + 1), True)
+        return total
+
+
 def extrapolate_second_diff(x, dx, y, dy, second_diff, number_of_cycles):
     for _ in range(number_of_cycles):
         x += dx
@@ -330,3 +447,15 @@ def test_garden():
     )
     # print(f"{TOTAL_PLOTS=}")
     assert TOTAL_PLOTS[1] == 623540829615589
+
+
+def test_tile_garden():
+    my_garden = Garden(RAW_INPUT)
+    tile_garden = TileGarden(RAW_INPUT)
+    assert tile_garden.plots(64) == 3746
+    for steps in [65, 130, 131, 200, 327, 400]:
+        assert tile_garden.plots(steps) == my_garden.step_range(
+            steps, finite_board=False
+        )
+    assert tile_garden.plots(26501365) == 623540829615589
+    assert tile_garden.plots(10**12) > 0
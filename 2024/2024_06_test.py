@@ -1,6 +1,9 @@
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, NamedTuple
 from collections import defaultdict
+from os import cpu_count
 
 
 class Puzzle:
@@ -346,6 +349,110 @@ class Factory:
             self.guard_dir = next_dir
 
 
+DIRECTIONS = [Pt(0, -1), Pt(1, 0), Pt(0, 1), Pt(-1, 0)]
+
+
+class GuardMap:
+    """
+    Obstacles kept as sorted coordinate lists per row and per column so the
+    guard jumps straight from turn to turn: the next blocker ahead is a bisect,
+    with one extra candidate obstacle compared against it. A loop is a repeat
+    of a (position, direction) turn state.
+    """
+
+    def __init__(self, map: List[str]):
+        map = [line for line in map if line]
+        self.height = len(map)
+        self.width = len(map[0])
+        self.rows = [[] for _ in range(self.height)]
+        self.columns = [[] for _ in range(self.width)]
+        for y, line in enumerate(map):
+            for x, c in enumerate(line):
+                if c == "#":
+                    self.rows[y].append(x)
+                    self.columns[x].append(y)
+                elif c == "^":
+                    self.guard_start = Pt(x, y)
+
+    def next_stop(self, pt, direction, extra=None):
+        """
+        Where the guard stops facing a blocker, or None if she walks off the map.
+        """
+        dx, dy = DIRECTIONS[direction]
+        if dx == 0:
+            line, along, across = self.columns[pt.x], pt.y, pt.x
+        else:
+            line, along, across = self.rows[pt.y], pt.x, pt.y
+        step = dx + dy
+        if step < 0:
+            i = bisect_left(line, along)
+            blocker = line[i - 1] if i > 0 else None
+        else:
+            i = bisect_right(line, along)
+            blocker = line[i] if i < len(line) else None
+        if extra is not None:
+            extra_across, extra_along = extra if dx == 0 else (extra.y, extra.x)
+            if extra_across == across and 0 < (extra_along - along) * step:
+                if blocker is None or (extra_along - blocker) * step < 0:
+                    blocker = extra_along
+        if blocker is None:
+            return None
+        stop = blocker - step
+        return Pt(across, stop) if dx == 0 else Pt(stop, across)
+
+    def patrol(self, extra=None):
+        """
+        Turn points of the patrol, and whether it ends in a loop.
+        """
+        pt, direction = self.guard_start, 0
+        turns = [(pt, direction)]
+        seen = {(pt, direction)}
+        while True:
+            stop = self.next_stop(pt, direction, extra)
+            if stop is None:
+                return turns, False
+            pt, direction = stop, (direction + 1) % 4
+            if (pt, direction) in seen:
+                return turns, True
+            seen.add((pt, direction))
+            turns.append((pt, direction))
+
+    def patrolled(self):
+        turns, looped = self.patrol()
+        cells = set()
+        # a looping patrol's last segment ends at the turn point it repeats
+        last_end = self.next_stop(*turns[-1]) if looped else None
+        ends = [pt for pt, _ in turns[1:]] + [last_end]
+        for (pt, direction), end in zip(turns, ends):
+            step = DIRECTIONS[direction]
+            while pt != end and 0 <= pt.x < self.width and 0 <= pt.y < self.height:
+                cells.add(pt)
+                pt += step
+            if end is not None:
+                cells.add(end)
+        return cells
+
+    def loop_obstacles(self, candidates):
+        return {pt for pt in candidates if self.patrol(extra=pt)[1]}
+
+
+def find_loop_obstacles(map: List[str], candidates):
+    return GuardMap(map).loop_obstacles(candidates)
+
+
+def loop_obstacles_parallel(map: List[str], workers=None):
+    """
+    Candidate obstacles are the patrolled cells other than the start, split
+    into one batch per worker process.
+    """
+    guard_map = GuardMap(map)
+    candidates = sorted(guard_map.patrolled() - {guard_map.guard_start})
+    workers = workers or cpu_count() or 1
+    batches = [candidates[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(workers) as pool:
+        return set().union(*pool.map(find_loop_obstacles, [map] * workers, batches))
+
+
 def test_obstacle_count():
     sample_factory = Factory(SAMPLE_MAP)
     assert len(sample_factory.obstacles) == 8
@@ -370,3 +477,15 @@ def test_patrolled_size_and_loop_obstacles():
     # Fixed but third answer 1985 was still too high
     # Realized wasn't checking loop_obstacles within range
     # Fixed and got 1984 which was finally right
+
+
+def test_guard_map():
+    sample_map = GuardMap(SAMPLE_MAP)
+    assert len(sample_map.patrolled()) == 41
+    assert len(loop_obstacles_parallel(SAMPLE_MAP, workers=2)) == 6
+    my_map = GuardMap(MY_MAP)
+    assert len(my_map.patrolled()) == 5404
+    assert len(loop_obstacles_parallel(MY_MAP)) == 1984
+    looping_map = GuardMap(["....", ".#.#", "..#.", ".^..", "#...", ".#.#"])
+    assert looping_map.patrol()[1]
+    assert looping_map.patrolled() == {Pt(1, 2), Pt(1, 3), Pt(1, 4)}
@@ -4,6 +4,8 @@ from typing import List, Dict, NamedTuple
 from collections import defaultdict
 from fractions import Fraction
 
+import numpy as np
+
 
 class Puzzle:
     """
@@ -274,6 +276,49 @@ class Bathroom:
         return result
 
 
+class Swarm:
+    """
+    Robot positions and velocities as numpy columns, so every robot's position
+    at time t is a single vectorised expression. The x and y coordinates repeat
+    with periods wide and tall independently, so the tree (the moment the robots
+    bunch up) is found by minimising variance in each axis on its own and
+    combining the two residues with the CRT.
+    """
+
+    def __init__(self, robots, wide, tall):
+        self.wide = wide
+        self.tall = tall
+        self.mid_x = (wide - 1) // 2
+        self.mid_y = (tall - 1) // 2
+        robots = [V.from_string(robot) for robot in robots if robot]
+        self.x = np.array([robot.x for robot in robots], dtype=np.int64)
+        self.y = np.array([robot.y for robot in robots], dtype=np.int64)
+        self.dx = np.array([robot.dx for robot in robots], dtype=np.int64)
+        self.dy = np.array([robot.dy for robot in robots], dtype=np.int64)
+
+    def positions(self, time):
+        return (self.x + time * self.dx) % self.wide, (
+            self.y + time * self.dy
+        ) % self.tall
+
+    def count_in_quadrant(self, time):
+        x, y = self.positions(time)
+        keep = (x != self.mid_x) & (y != self.mid_y)
+        quadrant = 2 * (x[keep] > self.mid_x) + (y[keep] > self.mid_y)
+        return int(np.prod(np.bincount(quadrant, minlength=4)))
+
+    @staticmethod
+    def tightest_time(start, velocity, period):
+        times = np.arange(period, dtype=np.int64)[:, None]
+        return int(np.argmin(((start + times * velocity) % period).var(axis=1)))
+
+    def find_tree_time(self):
+        time_x = self.tightest_time(self.x, self.dx, self.wide)
+        time_y = self.tightest_time(self.y, self.dy, self.tall)
+        steps = (time_y - time_x) * pow(self.wide, -1, self.tall) % self.tall
+        return time_x + self.wide * steps
+
+
 def test_sample():
     sample_bathroom = Bathroom(SAMPLE_ROBOTS, 11, 7)
     assert sample_bathroom.count_in_quadrant(100) == 12
@@ -391,3 +436,13 @@ def test_is_tree():
     assert my_bathroom.find_min_pixel_time() == ({4280}, {7916})
     is_tree = my_bathroom.display(7916)
     assert "\n".join(is_tree) == TREE
+
+
+def test_swarm():
+    assert Swarm(SAMPLE_ROBOTS, 11, 7).count_in_quadrant(100) == 12
+    my_swarm = Swarm(MY_ROBOTS, 101, 103)
+    assert my_swarm.count_in_quadrant(100) == 221142636
+    assert my_swarm.find_tree_time() == 7916
+    bathroom = Bathroom(MY_ROBOTS, 101, 103)
+    for time in (0, 1, 4280, 7916):
+        assert my_swarm.count_in_quadrant(time) == bathroom.count_in_quadrant(time)